@@ -0,0 +1,26 @@
+"""
+Fast JSON - orjson-backed encode/decode for API payloads.
+Falls back to the standard library when orjson is not installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document (bytes straight from a response body, or str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, ready to send as a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
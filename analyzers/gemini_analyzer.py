@@ -4,16 +4,81 @@ Provides summarization, key findings extraction, and categorization.
 """
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import atexit
+import heapq
+import json
 import logging
+import random
+import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from typing import Optional
 from collections.abc import Iterable
 
+import numpy as np
+
+from analyzers.indicators import FredIndicators, format_key_numbers
+from analyzers.llm_cache import ExactCache, SemanticCache
+from analyzers.rate_limiter import TokenBucket
+from analyzers.themes import THEME_KEYWORDS
 from collectors.base_collector import Article
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Feed/page boilerplate that adds prompt tokens but no meaning
+BOILERPLATE_PATTERN = re.compile(
+    r'\[?(?:…|\.\.\.)\]|read more|continue reading|click here|subscribe now'
+    r'|the post .{0,200}? appeared first on .{0,100}?(?:\.|$)',
+    re.IGNORECASE
+)
+
+# Whitespace and quote characters wrapped around model one-liners
+QUOTE_STRIP_PATTERN = re.compile(r'^[\s"\']+|[\s"\']+$')
+
+# Transient API failures worth retrying with backoff
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+)
+
+# Rule-based categories, checked in order (first match wins)
+CATEGORY_KEYWORDS = {
+    'Monetary Policy': ('interest rate', 'monetary policy', 'central bank', 'inflation target', 'policy rate'),
+    'Fiscal Policy': ('budget', 'fiscal', 'government spending', 'taxation', 'deficit'),
+    'Trade & Tariffs': ('trade', 'tariff', 'export', 'import', 'wto', 'trade war'),
+    'Employment': ('employment', 'unemployment', 'jobs', 'labor', 'workforce', 'wage'),
+    'GDP & Growth': ('gdp', 'growth', 'recession', 'economic outlook', 'expansion'),
+    'Inflation': ('inflation', 'cpi', 'price', 'deflation', 'consumer price'),
+    'Financial Markets': ('market', 'stock', 'bond', 'equity', 'forex', 'currency'),
+    'Banking & Finance': ('bank', 'lending', 'credit', 'financial stability', 'liquidity'),
+    'Development': ('development', 'poverty', 'inequality', 'sdg', 'sustainable'),
+    'Industry & Sector': ('industry', 'sector', 'manufacturing', 'services', 'technology'),
+    'Rating Actions': ('rating', 'downgrade', 'upgrade', 'credit rating', 'outlook'),
+    'Data Release': ('data', 'statistics', 'indicator', 'release', 'figures'),
+}
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one escaped alternation (substring match)."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Compiled once at import and shared by every analyzer instance
+# (keywords are lowercase; matched against lowercased article text)
+_CATEGORY_PATTERNS = {
+    category: _keyword_pattern(keywords) for category, keywords in CATEGORY_KEYWORDS.items()
+}
+_THEME_PATTERNS = {
+    theme: _keyword_pattern(keywords) for theme, keywords in THEME_KEYWORDS.items()
+}
+
 
 class GeminiAnalyzer:
     """
@@ -21,8 +86,75 @@ class GeminiAnalyzer:
     Provides summarization and analysis for economic reports and articles.
     """
     
-    def __init__(self):
-        """Initialize the Gemini analyzer."""
+    # Importance scoring inputs (see _calculate_importance / _score_articles)
+    CRITICAL_SOURCES = ['Fed', 'ECB', 'RBI', 'IMF', 'World Bank', 'BoE', 'BoJ', 'PBoC']
+    HIGH_SOURCES = ['OECD', 'WEF', 'BIS', 'McKinsey', 'Goldman Sachs', 'JP Morgan']
+    MAJOR_CONTENT_TYPES = ['report', 'data_release', 'speech']
+    MINOR_CONTENT_TYPES = ['working_paper', 'expert_opinion']
+    CRITICAL_KEYWORDS = ['rate decision', 'fomc', 'mpc', 'gdp', 'inflation', 'recession',
+                         'crisis', 'emergency', 'downgrade', 'upgrade', 'outlook']
+    
+    # Major-item detection (see _is_major_item)
+    MAJOR_ITEM_TYPES = frozenset(['report', 'working_paper', 'speech', 'data_release'])
+    MAJOR_ORGS = frozenset(['IMF', 'World Bank', 'RBI', 'OECD', 'WEF', 'BIS', 'McKinsey', 'Deloitte',
+                            'BCG', 'PwC', 'Goldman Sachs', 'JP Morgan', 'Brookings', 'PIIE'])
+    KEY_REPORT_PHRASES = ['outlook', 'report', 'survey', 'forecast', 'index', 'review',
+                          'economic survey', 'annual report', 'quarterly', 'bulletin']
+    
+    # Recognized global authorities (see _is_expert_opinion)
+    NOTABLE_EXPERTS = [
+        # Nobel laureates in Economics
+        'paul krugman', 'joseph stiglitz', 'robert shiller', 'eugene fama',
+        'richard thaler', 'angus deaton', 'jean tirole', 'bengt holmström',
+        'abhijit banerjee', 'esther duflo', 'michael kremer',
+        # Chief Economists and Central Bankers
+        'gita gopinath', 'pierre-olivier gourinchas', 'carmen reinhart',
+        'raghuram rajan', 'urjit patel', 'shaktikanta das',
+        'janet yellen', 'jerome powell', 'christine lagarde', 'mark carney',
+        'mario draghi', 'ben bernanke', 'alan greenspan',
+        # Other prominent economists
+        'nouriel roubini', 'mohamed el-erian', 'larry summers',
+        'kenneth rogoff', 'dani rodrik', 'arvind subramanian',
+        'martin wolf', 'gillian tett', 'rana foroohar'
+    ]
+    OPINION_INDICATORS = ['opinion', 'op-ed', 'commentary', 'perspective', 'viewpoint', 'analysis by']
+    OPINION_SOURCES = ['FT', 'WSJ', 'Bloomberg', 'Reuters', 'Brookings', 'PIIE']
+    AUTHORITY_TITLES = ['chief economist', 'former governor', 'nobel laureate',
+                        'professor', 'dr.', 'director', 'chairman', 'president']
+    
+    _critical_keyword_pattern = _keyword_pattern(CRITICAL_KEYWORDS)
+    _key_phrase_pattern = _keyword_pattern(KEY_REPORT_PHRASES)
+    _expert_pattern = _keyword_pattern(NOTABLE_EXPERTS)
+    _opinion_pattern = _keyword_pattern(OPINION_INDICATORS)
+    _opinion_source_pattern = _keyword_pattern(OPINION_SOURCES)
+    _authority_pattern = _keyword_pattern(AUTHORITY_TITLES)
+    
+    # Source -> region mapping for the geographic summary (unknown sources are Global)
+    SOURCE_REGIONS = {
+        # Americas
+        'Fed': 'Americas', 'NBER': 'Americas', 'Brookings': 'Americas', 'PIIE': 'Americas',
+        'WSJ': 'Americas', 'Goldman Sachs': 'Americas', 'JP Morgan': 'Americas',
+        # Europe
+        'ECB': 'Europe', 'BoE': 'Europe', 'Bruegel': 'Europe', 'FT': 'Europe',
+        # Asia-Pacific
+        'BoJ': 'Asia-Pacific', 'PBoC': 'Asia-Pacific', 'ADB': 'Asia-Pacific',
+        # India-specific
+        'RBI': 'India', 'MoF India': 'India', 'MoSPI': 'India', 'NITI Aayog': 'India',
+        # Global/International
+        'IMF': 'Global', 'World Bank': 'Global', 'OECD': 'Global', 'WTO': 'Global',
+        'WEF': 'Global', 'BIS': 'Global', 'ILO': 'Global', 'UNCTAD': 'Global',
+        # Consulting (Global)
+        'McKinsey': 'Global', 'Deloitte': 'Global', 'BCG': 'Global', 'PwC': 'Global',
+    }
+    REGIONS = ['Global', 'Americas', 'Europe', 'Asia-Pacific', 'India']
+    
+    def __init__(self, indicators: Optional[FredIndicators] = None):
+        """
+        Initialize the Gemini analyzer.
+        
+        Args:
+            indicators: Shared FRED provider (one is created if omitted)
+        """
         if not Settings.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY not set in environment")
         
@@ -33,14 +165,32 @@ class GeminiAnalyzer:
         # Supports text and vision (for chart analysis)
         self.model = genai.GenerativeModel('gemini-2.0-flash')
         
+        # One-line summaries are the bulk of calls and need little reasoning -
+        # route them to the faster, cheaper Flash-Lite model
+        self.model_lite = genai.GenerativeModel('gemini-2.0-flash-lite')
+        
         # Rate limiting - conservative for free tier
         # Free tier: 15 requests/minute, ~1500/day for gemini-2.0-flash
-        # We use 10/minute to be safe and avoid hitting limits
+        # We use 10/minute to be safe; the bucket allows bursts up to that
         self.requests_per_minute = 10
-        self.request_count = 0
-        self.last_reset = time.time()
-        self.min_delay_between_requests = 4  # 4 seconds between API calls
-        self.last_request_time = 0
+        self.rate_limiter = TokenBucket(
+            capacity=self.requests_per_minute,
+            refill_rate=self.requests_per_minute / 60,
+            name="GEMINI"
+        )
+        
+        # Daily request budget (free tier ~1500/day) as a second, slow bucket
+        self.requests_per_day = 1500
+        self.daily_limiter = TokenBucket(
+            capacity=self.requests_per_day,
+            refill_rate=self.requests_per_day / 86400,
+            name="GEMINI-DAY"
+        )
+        
+        # Limiter state survives restarts so a rerun can't overshoot the real quota
+        self.rate_state_file = Settings.CACHE_DIR / 'rate_limiter.json'
+        self._load_rate_state()
+        atexit.register(self._save_rate_state)
         
         # Quota exhaustion detection
         self.consecutive_quota_errors = 0
@@ -48,35 +198,124 @@ class GeminiAnalyzer:
         self.quota_exhausted = False
         self.successful_requests = 0
         self.failed_requests = 0
+        
+        # analyze_batch runs articles on worker threads, so the
+        # success/error counters are shared state guarded by a lock
+        self._stats_lock = threading.Lock()
+        
+        # Near-duplicate articles (same report syndicated by several outlets)
+        # reuse earlier summaries/analyses instead of new generation calls
+        self.embedding_model = 'models/text-embedding-004'
+        self.summary_batch_size = 8  # Articles summarized per prompt in analyze_batch
+        
+        # Key economic numbers come from FRED, no AI needed
+        self.indicators = indicators or FredIndicators()
+        atexit.register(self.indicators.session.close)
+        
+        self.semantic_cache = SemanticCache(Settings.CACHE_DIR / 'llm_cache.json')
+        atexit.register(self.semantic_cache.save)
+        
+        # Identical prompts (e.g. reruns over the same week) skip the API entirely
+        self.exact_cache = ExactCache(Settings.CACHE_DIR / 'llm_exact_cache.json')
+        atexit.register(self.exact_cache.save)
+        
+        # Articles already analyzed in an earlier run, keyed by URL
+        self.url_cache = ExactCache(Settings.CACHE_DIR / 'url_cache.json')
+        atexit.register(self.url_cache.save)
     
     def _check_rate_limit(self):
-        """Check and enforce rate limiting with conservative delays."""
+        """
+        Check whether API calls are still allowed.
+        
+        Pacing itself happens in _generate, which every model call goes
+        through, so retries are throttled too.
+        """
         # If quota is exhausted, skip all API calls
-        if self.quota_exhausted:
-            return False
-        
-        # Ensure minimum delay between requests
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.min_delay_between_requests:
-            sleep_time = self.min_delay_between_requests - time_since_last
-            time.sleep(sleep_time)
-        
-        current_time = time.time()
-        if current_time - self.last_reset > 60:
-            self.request_count = 0
-            self.last_reset = current_time
-        
-        if self.request_count >= self.requests_per_minute:
-            wait_time = 65 - (current_time - self.last_reset)  # Wait a bit extra
-            if wait_time > 0:
-                logger.info(f"Rate limit reached, waiting {wait_time:.1f}s")
+        return not self.quota_exhausted
+    
+    def _generate(self, *args, model=None, max_tries: int = 3, **kwargs):
+        """
+        Call a Gemini model (default: self.model) once a rate-limit token is available.
+        
+        Transient errors (429/5xx/timeouts) are retried with exponential
+        backoff plus jitter; each attempt takes its own token. The sleep
+        only blocks the calling worker thread, not other requests.
+        """
+        for attempt in range(max_tries):
+            # Fail fast rather than block for hours when the daily budget is
+            # spent, so callers fall back and the report still completes
+            if not self.daily_limiter.try_consume(1):
+                self._mark_daily_budget_exhausted()
+                raise RuntimeError("Daily Gemini request budget exhausted")
+            self.rate_limiter.consume(1)
+            try:
+                return (model or self.model).generate_content(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == max_tries - 1:
+                    raise
+                wait_time = 2 ** attempt + random.random() * 0.5
+                logger.warning(f"Transient Gemini error ({type(e).__name__}), retrying in {wait_time:.1f}s")
                 time.sleep(wait_time)
-                self.request_count = 0
-                self.last_reset = time.time()
+    
+    def _mark_daily_budget_exhausted(self):
+        """Switch to graceful degradation once the daily bucket is empty."""
+        if not self.quota_exhausted:
+            self.quota_exhausted = True
+            logger.warning(
+                f"Daily Gemini budget of {self.requests_per_day} requests reached - "
+                f"switching to graceful degradation mode."
+            )
+    
+    def _load_rate_state(self):
+        """Restore limiter state saved by a previous run."""
+        if not self.rate_state_file.exists():
+            return
+        try:
+            with open(self.rate_state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.rate_limiter.set_state(state.get('minute', {}))
+            self.daily_limiter.set_state(state.get('day', {}))
+        except Exception as e:
+            logger.warning(f"Could not load rate limiter state: {e}")
+    
+    def _save_rate_state(self):
+        """Persist limiter state for the next run."""
+        try:
+            self.rate_state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.rate_state_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'minute': self.rate_limiter.get_state(),
+                    'day': self.daily_limiter.get_state(),
+                }, f)
+        except Exception as e:
+            logger.warning(f"Could not save rate limiter state: {e}")
+    
+    def _cached_generate(self, prompt: str, model=None, stream: bool = False) -> str:
+        """
+        Return the response text for a prompt, from the exact cache when possible.
         
-        self.request_count += 1
-        self.last_request_time = time.time()
-        return True
+        Args:
+            prompt: Prompt text
+            model: Model to use (default: self.model)
+            stream: Consume the response chunk by chunk as it is generated;
+                used for long-form output so progress is visible early
+        """
+        model = model or self.model
+        key = self.exact_cache.key(f"{model.model_name}\n{prompt}")
+        cached = self.exact_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if stream:
+            chunks = []
+            for chunk in self._generate(prompt, model=model, stream=True):
+                chunks.append(chunk.text)
+                logger.debug(f"Streaming response: {sum(map(len, chunks))} chars received")
+            text = ''.join(chunks)
+        else:
+            text = self._generate(prompt, model=model).text
+        self.exact_cache.set(key, text)
+        return text
     
     def _handle_api_error(self, error: Exception) -> bool:
         """
@@ -89,15 +328,17 @@ class GeminiAnalyzer:
         
         # Check for quota/rate limit errors
         if '429' in error_str or 'resource_exhausted' in error_str or 'quota' in error_str:
-            self.consecutive_quota_errors += 1
-            self.failed_requests += 1
+            with self._stats_lock:
+                self.consecutive_quota_errors += 1
+                self.failed_requests += 1
+                error_count = self.consecutive_quota_errors
             
             logger.warning(
-                f"Quota error #{self.consecutive_quota_errors}/{self.max_consecutive_quota_errors}: {error}"
+                f"Quota error #{error_count}/{self.max_consecutive_quota_errors}: {error}"
             )
             
             # If we hit the threshold, mark quota as exhausted
-            if self.consecutive_quota_errors >= self.max_consecutive_quota_errors:
+            if error_count >= self.max_consecutive_quota_errors:
                 self.quota_exhausted = True
                 logger.error(
                     f"=== QUOTA EXHAUSTED ===\n"
@@ -110,30 +351,56 @@ class GeminiAnalyzer:
                 return False
             
             # For first few errors, wait and retry
-            wait_time = min(30 * self.consecutive_quota_errors, 120)  # Max 2 min wait
+            wait_time = min(30 * error_count, 120)  # Max 2 min wait
             logger.info(f"Waiting {wait_time}s before retry...")
             time.sleep(wait_time)
             return True
         
         # Non-quota errors: don't count as quota issues
-        self.failed_requests += 1
+        with self._stats_lock:
+            self.failed_requests += 1
         return False
     
     def _mark_success(self):
         """Mark a successful API call - resets consecutive error counter."""
-        self.consecutive_quota_errors = 0
-        self.successful_requests += 1
+        with self._stats_lock:
+            self.consecutive_quota_errors = 0
+            self.successful_requests += 1
     
-    def analyze_article(self, article: Article) -> Article:
+    def analyze_article(self, article: Article, summary: Optional[str] = None,
+                        lookup: Optional[tuple] = None, score: bool = True) -> Article:
         """
         Analyze a single article and populate AI fields.
         
         Args:
             article: Article to analyze
+            summary: One-liner already generated by a batched prompt, if any
+            lookup: Precomputed (embedding, cached entry) from _semantic_lookup
+            score: Compute importance here; analyze_batch scores all articles at once instead
         
         Returns:
             Article with ai_summary and ai_analysis populated
         """
+        self._prepare_text(article)
+        
+        # Previously analyzed URL - rehydrate without any API calls
+        known = self._cached_by_url(article)
+        if known:
+            article.ai_summary = known['summary']
+            article.ai_analysis = known['analysis']
+            article.ai_category = known['category']
+            article.themes = list(known['themes'])
+            # Restore the expert_opinion re-tag so scoring matches a fresh run
+            if 'content_type' in known:
+                article.content_type = known['content_type']
+            else:
+                self._is_major_item(article)  # Entries stored before content_type was kept
+            if score:
+                article.importance_score = self._calculate_importance(article)
+                article.importance_level = self._get_importance_level(article.importance_score)
+            article.verification_status = "verified"
+            return article
+        
         # If quota is exhausted, skip AI and use fallback
         if self.quota_exhausted:
             return self._fallback_analysis(article)
@@ -143,27 +410,49 @@ class GeminiAnalyzer:
             if not can_proceed:
                 return self._fallback_analysis(article)
             
+            # Reuse output from a near-duplicate article if we have one
+            embedding, cached = lookup if lookup is not None else self._semantic_lookup(article)
+            
             # Generate one-liner summary for Excel with retry
-            article.ai_summary = self._safe_generate(
-                lambda: self._generate_summary(article),
-                fallback=article.summary[:150] if article.summary else "Summary not available"
-            )
+            fallback_summary = article.summary[:150] if article.summary else "Summary not available"
+            if cached and cached.get('summary'):
+                article.ai_summary = cached['summary']
+            elif summary:
+                article.ai_summary = summary
+            else:
+                article.ai_summary = self._safe_generate(
+                    lambda: self._generate_summary(article),
+                    fallback=fallback_summary
+                )
             
             # Generate detailed analysis for document (only for major items)
             if self._is_major_item(article) and not self.quota_exhausted:
-                can_proceed = self._check_rate_limit()
-                if can_proceed:
-                    article.ai_analysis = self._safe_generate(
-                        lambda: self._generate_analysis(article),
-                        fallback=""
-                    )
+                if cached and cached.get('analysis'):
+                    article.ai_analysis = cached['analysis']
+                else:
+                    can_proceed = self._check_rate_limit()
+                    if can_proceed:
+                        article.ai_analysis = self._safe_generate(
+                            lambda: self._generate_analysis(article),
+                            fallback=""
+                        )
+            
+            # Remember fresh model output (never fallbacks) for later duplicates
+            fresh_summary = article.ai_summary if article.ai_summary != fallback_summary else ""
+            if embedding:
+                if cached:
+                    if article.ai_analysis and not cached.get('analysis'):
+                        self.semantic_cache.update(cached, analysis=article.ai_analysis)
+                elif fresh_summary:
+                    self.semantic_cache.add(embedding, fresh_summary, article.ai_analysis)
             
             # Categorize the article (no API call, just keywords)
             article.ai_category = self._categorize(article)
             
             # Calculate importance score (no API call)
-            article.importance_score = self._calculate_importance(article)
-            article.importance_level = self._get_importance_level(article.importance_score)
+            if score:
+                article.importance_score = self._calculate_importance(article)
+                article.importance_level = self._get_importance_level(article.importance_score)
             
             # Assign themes for grouping (no API call)
             article.themes = self._assign_themes(article)
@@ -171,6 +460,18 @@ class GeminiAnalyzer:
             # Set verification status
             article.verification_status = "verified" if article.ai_summary and not self.quota_exhausted else "partial"
             
+            # Only persist complete model output, so fallbacks are retried next run
+            analysis_complete = bool(article.ai_analysis) or not self._is_major_item(article)
+            if (article.verification_status == "verified" and fresh_summary
+                    and analysis_complete and article.url != '#'):
+                self.url_cache.set(article.url, {
+                    'summary': article.ai_summary,
+                    'analysis': article.ai_analysis,
+                    'category': article.ai_category,
+                    'themes': list(article.themes),
+                    'content_type': article.content_type,
+                })
+            
             logger.debug(f"Analyzed: {article.title[:50]}...")
             
         except Exception as e:
@@ -179,6 +480,47 @@ class GeminiAnalyzer:
         
         return article
     
+    def _cached_by_url(self, article: Article) -> Optional[dict]:
+        """Return the stored analysis for an article URL seen in an earlier run."""
+        if article.url == '#':
+            return None
+        return self.url_cache.get(article.url)
+    
+    @staticmethod
+    def _prepare_text(article: Article):
+        """Lowercase title/summary once so the keyword matchers can share them."""
+        article._title_lower = article.title.lower()
+        article._summary_lower = (article.summary or '').lower()
+        article._combined_lower = f"{article._title_lower} {article._summary_lower}"
+    
+    def _lowered(self, article: Article) -> tuple[str, str, str]:
+        """Return cached (title, summary, title + summary) lowercase text."""
+        if not article._combined_lower:
+            self._prepare_text(article)
+        return article._title_lower, article._summary_lower, article._combined_lower
+    
+    def _semantic_lookup(self, article: Article) -> tuple:
+        """Return (embedding, cached entry or None) for an article."""
+        embedding = self._embed_article(article)
+        cached = self.semantic_cache.lookup(embedding) if embedding else None
+        return embedding, cached
+    
+    def _embed_article(self, article: Article) -> Optional[list[float]]:
+        """Embed title + summary for semantic cache lookups (None on failure)."""
+        text = f"{article.title} {(article.summary or '')[:500]}".strip()
+        if not text:
+            return None
+        try:
+            result = genai.embed_content(
+                model=self.embedding_model,
+                content=text,
+                task_type='semantic_similarity'
+            )
+            return result['embedding']
+        except Exception as e:
+            logger.debug(f"Embedding failed, skipping semantic cache: {e}")
+            return None
+    
     def _safe_generate(self, func, fallback, max_retries: int = 2):
         """Safely call a generation function with retry and fallback."""
         for attempt in range(max_retries):
@@ -194,6 +536,7 @@ class GeminiAnalyzer:
     
     def _fallback_analysis(self, article: Article) -> Article:
         """Provide fallback analysis when quota is exhausted."""
+        self._prepare_text(article)
         article.ai_summary = article.summary[:150] if article.summary else "AI analysis unavailable (quota exhausted)"
         article.ai_analysis = ""
         article.ai_category = self._categorize(article)  # Keyword-based, no API
@@ -203,31 +546,148 @@ class GeminiAnalyzer:
         article.verification_status = "unverified"
         return article
     
-    def analyze_batch(self, articles: list[Article], batch_size: int = 10) -> list[Article]:
+    def analyze_batch(self, articles: list[Article], batch_size: int = 10,
+                      max_concurrent: int = 5) -> list[Article]:
         """
-        Analyze multiple articles efficiently.
+        Analyze multiple articles concurrently.
+        
+        Articles are split into groups of summary_batch_size whose one-liners
+        are generated in a single prompt; groups run on a small thread pool
+        while the shared rate limiter enforces the per-minute ceiling.
         
         Args:
             articles: List of articles to analyze
-            batch_size: Number of articles to process before a longer pause
+            batch_size: Number of completed articles between progress logs
+            max_concurrent: Maximum number of groups analyzed in parallel
         
         Returns:
-            List of analyzed articles
+            List of analyzed articles, in input order
         """
-        analyzed = []
         total = len(articles)
-        
-        for i, article in enumerate(articles):
-            analyzed_article = self.analyze_article(article)
-            analyzed.append(analyzed_article)
+        analyzed = list(articles)
+        step = self.summary_batch_size
+        done = 0
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrent)) as executor:
+            future_to_start = {
+                executor.submit(self._analyze_group, articles[start:start + step]): start
+                for start in range(0, total, step)
+            }
             
-            if (i + 1) % batch_size == 0:
-                logger.info(f"Analyzed {i + 1}/{total} articles")
-                time.sleep(2)  # Pause between batches
-        
-        logger.info(f"Analysis complete: {len(analyzed)} articles processed")
+            for future in as_completed(future_to_start):
+                start = future_to_start[future]
+                group = articles[start:start + step]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(f"Error analyzing articles {start + 1}-{start + len(group)}: {e}")
+                    results = [self._fallback_analysis(article) for article in group]
+                analyzed[start:start + len(results)] = results
+                
+                previous, done = done, done + len(results)
+                if done // batch_size > previous // batch_size:
+                    logger.info(f"Analyzed {done}/{total} articles")
+        
+        # Score everything in one vectorized pass (content types are final now)
+        self._score_articles(analyzed)
+        
+        self.semantic_cache.save()
+        self.exact_cache.save()
+        self.url_cache.save()
+        logger.info(
+            f"Analysis complete: {len(analyzed)} articles processed "
+            f"({self.semantic_cache.hits} semantic cache hits)"
+        )
         return analyzed
     
+    def _analyze_group(self, group: list[Article]) -> list[Article]:
+        """Analyze a small group of articles, summarizing them in one prompt."""
+        if self.quota_exhausted:
+            return [self._fallback_analysis(article) for article in group]
+        
+        # Articles analyzed in an earlier run need no embedding or summary
+        known = {i for i, article in enumerate(group) if self._cached_by_url(article)}
+        lookups = [
+            (None, None) if i in known else self._semantic_lookup(article)
+            for i, article in enumerate(group)
+        ]
+        
+        # Only articles without a cached summary need one generated
+        pending = [
+            (i, article) for i, (article, (_, cached)) in enumerate(zip(group, lookups))
+            if i not in known and not (cached and cached.get('summary'))
+        ]
+        summaries = {}
+        if len(pending) > 1:
+            batch = self._generate_summaries_batch([article for _, article in pending])
+            summaries = {i: summary for (i, _), summary in zip(pending, batch)}
+        
+        # Anything the batch could not resolve is summarized individually
+        return [
+            self.analyze_article(article, summary=summaries.get(i), lookup=lookups[i], score=False)
+            for i, article in enumerate(group)
+        ]
+    
+    def _generate_summaries_batch(self, articles: list[Article]) -> list[Optional[str]]:
+        """
+        Generate one-liner summaries for several articles in a single prompt.
+        
+        Returns:
+            One summary per article, in order; None where the batch failed
+        """
+        if self.quota_exhausted:
+            return [None] * len(articles)
+        
+        items = "\n\n".join(
+            f"[{i}] Title: {a.title}\n"
+            f"Source: {a.source_full}\n"
+            f"Category: {a.category}\n"
+            f"Content: {self._compress_content(a.summary or a.content_preview) or 'No content available'}"
+            for i, a in enumerate(articles, 1)
+        )
+        prompt = f"""Generate a single-sentence summary (max 100 words) for EACH of the following {len(articles)} economic/financial items.
+Each summary should capture the key finding or main point.
+Write in a professional but accessible tone suitable for general readers.
+
+{items}
+
+Return ONLY a JSON array of exactly {len(articles)} strings, one summary per item, in the same order. No other text."""
+
+        text = self._safe_generate(
+            lambda: self._cached_generate(prompt, model=self.model_lite),
+            fallback=None
+        )
+        if not text:
+            return [None] * len(articles)
+        
+        try:
+            cleaned = re.sub(r'^```(?:json)?\s*|\s*```$', '', text.strip())
+            summaries = json.loads(cleaned)
+            if not isinstance(summaries, list) or len(summaries) != len(articles):
+                raise ValueError(f"expected {len(articles)} summaries, got {len(summaries)}")
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Batch summary parse failed, falling back to per-article calls: {e}")
+            return [None] * len(articles)
+        
+        return [
+            QUOTE_STRIP_PATTERN.sub('', str(summary))[:300] or None if summary else None
+            for summary in summaries
+        ]
+    
+    @staticmethod
+    def _compress_content(text: str, limit: int = 400) -> str:
+        """
+        Trim article content for one-line summary prompts.
+        
+        Drops feed boilerplate, collapses whitespace and cuts at a word
+        boundary - the model only needs the gist to write one sentence.
+        """
+        text = BOILERPLATE_PATTERN.sub(' ', text or '')
+        text = ' '.join(text.split())
+        if len(text) > limit:
+            text = text[:limit].rsplit(' ', 1)[0] + '...'
+        return text
+    
     def _generate_summary(self, article: Article) -> str:
         """Generate a one-liner summary for Excel."""
         prompt = f"""Generate a single-sentence summary (max 100 words) of this economic/financial content.
@@ -239,15 +699,13 @@ Source: {article.source_full}
 Category: {article.category}
 
 Content/Description:
-{article.summary or article.content_preview or 'No content available'}
+{self._compress_content(article.summary or article.content_preview) or 'No content available'}
 
 Provide ONLY the one-line summary, no other text."""
 
         try:
-            response = self.model.generate_content(prompt)
-            summary = response.text.strip()
-            # Clean up any quotes or extra formatting
-            summary = summary.strip('"\'')
+            # Clean up surrounding whitespace/quotes in one pass
+            summary = QUOTE_STRIP_PATTERN.sub('', self._cached_generate(prompt, model=self.model_lite))
             return summary[:300]  # Limit length
         except Exception as e:
             logger.error(f"Summary generation failed: {e}")
@@ -297,36 +755,18 @@ CRITICAL RULES:
 - Bold key numbers and findings"""
 
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached_generate(prompt, stream=True).strip()
         except Exception as e:
             logger.error(f"Analysis generation failed: {e}")
             return ""
     
     def _categorize(self, article: Article) -> str:
         """Determine the category of the article."""
-        title_lower = article.title.lower()
-        summary_lower = (article.summary or '').lower()
-        combined = f"{title_lower} {summary_lower}"
-        
-        # Simple rule-based categorization
-        categories = {
-            'Monetary Policy': ['interest rate', 'monetary policy', 'central bank', 'inflation target', 'policy rate'],
-            'Fiscal Policy': ['budget', 'fiscal', 'government spending', 'taxation', 'deficit'],
-            'Trade & Tariffs': ['trade', 'tariff', 'export', 'import', 'wto', 'trade war'],
-            'Employment': ['employment', 'unemployment', 'jobs', 'labor', 'workforce', 'wage'],
-            'GDP & Growth': ['gdp', 'growth', 'recession', 'economic outlook', 'expansion'],
-            'Inflation': ['inflation', 'cpi', 'price', 'deflation', 'consumer price'],
-            'Financial Markets': ['market', 'stock', 'bond', 'equity', 'forex', 'currency'],
-            'Banking & Finance': ['bank', 'lending', 'credit', 'financial stability', 'liquidity'],
-            'Development': ['development', 'poverty', 'inequality', 'sdg', 'sustainable'],
-            'Industry & Sector': ['industry', 'sector', 'manufacturing', 'services', 'technology'],
-            'Rating Actions': ['rating', 'downgrade', 'upgrade', 'credit rating', 'outlook'],
-            'Data Release': ['data', 'statistics', 'indicator', 'release', 'figures'],
-        }
+        _, _, combined = self._lowered(article)
         
-        for category, keywords in categories.items():
-            if any(kw in combined for kw in keywords):
+        # Simple rule-based categorization - first matching category wins
+        for category, pattern in _CATEGORY_PATTERNS.items():
+            if pattern.search(combined):
                 return category
         
         return 'General Economic'
@@ -334,22 +774,16 @@ CRITICAL RULES:
     def _is_major_item(self, article: Article) -> bool:
         """Determine if an article is major enough for detailed analysis."""
         # Reports, working papers, and speeches get full analysis
-        major_types = ['report', 'working_paper', 'speech', 'data_release']
-        if article.content_type in major_types:
+        if article.content_type in self.MAJOR_ITEM_TYPES:
             return True
         
         # Items from key organizations get analysis
-        major_orgs = ['IMF', 'World Bank', 'RBI', 'OECD', 'WEF', 'BIS', 'McKinsey', 'Deloitte',
-                      'BCG', 'PwC', 'Goldman Sachs', 'JP Morgan', 'Brookings', 'PIIE']
-        if article.source in major_orgs:
+        if article.source in self.MAJOR_ORGS:
             return True
         
         # Items with key report names
-        if article.title.lower():
-            key_phrases = ['outlook', 'report', 'survey', 'forecast', 'index', 'review', 
-                          'economic survey', 'annual report', 'quarterly', 'bulletin']
-            if any(phrase in article.title.lower() for phrase in key_phrases):
-                return True
+        if self._key_phrase_pattern.search(self._lowered(article)[0]):
+            return True
         
         # Check if it's an expert opinion piece
         if self._is_expert_opinion(article):
@@ -362,70 +796,42 @@ CRITICAL RULES:
         Check if article is an opinion piece from a recognized authority.
         Includes Nobel laureates, Chief Economists, former central bankers, etc.
         """
-        # List of recognized global authorities
-        notable_experts = [
-            # Nobel laureates in Economics
-            'paul krugman', 'joseph stiglitz', 'robert shiller', 'eugene fama',
-            'richard thaler', 'angus deaton', 'jean tirole', 'bengt holmström',
-            'abhijit banerjee', 'esther duflo', 'michael kremer',
-            # Chief Economists and Central Bankers
-            'gita gopinath', 'pierre-olivier gourinchas', 'carmen reinhart',
-            'raghuram rajan', 'urjit patel', 'shaktikanta das',
-            'janet yellen', 'jerome powell', 'christine lagarde', 'mark carney',
-            'mario draghi', 'ben bernanke', 'alan greenspan',
-            # Other prominent economists
-            'nouriel roubini', 'mohamed el-erian', 'larry summers',
-            'kenneth rogoff', 'dani rodrik', 'arvind subramanian',
-            'martin wolf', 'gillian tett', 'rana foroohar'
-        ]
-        
-        # Check author field
         author_lower = (article.author or '').lower()
-        title_lower = article.title.lower()
-        content_lower = (article.summary or '').lower()
-        
-        for expert in notable_experts:
-            if expert in author_lower or expert in title_lower or expert in content_lower:
-                article.content_type = 'expert_opinion'  # Tag it
-                return True
+        title_lower, content_lower, _ = self._lowered(article)
         
-        # Check for opinion indicators from these sources
-        opinion_indicators = ['opinion', 'op-ed', 'commentary', 'perspective', 'viewpoint', 'analysis by']
-        is_opinion = any(ind in title_lower for ind in opinion_indicators)
+        # One scan over author, title and content (names never contain '|')
+        if self._expert_pattern.search(f"{author_lower} | {title_lower} | {content_lower}"):
+            article.content_type = 'expert_opinion'  # Tag it
+            return True
         
         # Only include opinions if they seem to be from authorities
-        if is_opinion and any(org in article.source for org in ['FT', 'WSJ', 'Bloomberg', 'Reuters', 'Brookings', 'PIIE']):
-            # Check for title indicators of authority
-            authority_titles = ['chief economist', 'former governor', 'nobel laureate', 
-                               'professor', 'dr.', 'director', 'chairman', 'president']
-            if any(title in content_lower or title in author_lower for title in authority_titles):
-                article.content_type = 'expert_opinion'
-                return True
+        if (self._opinion_pattern.search(title_lower)
+                and self._opinion_source_pattern.search(article.source)
+                and self._authority_pattern.search(f"{content_lower} | {author_lower}")):
+            article.content_type = 'expert_opinion'
+            return True
         
         return False
     
-    def generate_executive_summary(self, articles: list[Article], date_range: str) -> str:
+    def generate_executive_summary(self, articles: list[Article], date_range: str,
+                                   indexes: Optional[dict] = None) -> str:
         """
         Generate an executive summary for The Global Pulse Weekly Report.
         
         Args:
             articles: All articles collected this week
             date_range: String describing the date range (e.g., "January 7-14, 2025")
+            indexes: Prebuilt groupings from _build_indexes (built if omitted)
         
         Returns:
             Executive summary text
         """
-        # Group by category for summary
-        by_category = {}
-        for article in articles:
-            cat = article.ai_category or article.category
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(article.title)
+        indexes = indexes or self._build_indexes(articles)
+        by_category = indexes['by_category']
         
         category_summary = "\n".join([
             f"- {cat}: {len(titles)} items"
-            for cat, titles in sorted(by_category.items(), key=lambda x: -len(x[1]))
+            for cat, titles in sorted(by_category.items(), key=lambda x: len(x[1]), reverse=True)
         ])
         
         # Get top headlines
@@ -478,9 +884,7 @@ WRITING STYLE:
 - Make it engaging - this goes to busy executives who need the essence quickly"""
 
         try:
-            self._check_rate_limit()
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached_generate(prompt, stream=True).strip()
         except Exception as e:
             logger.error(f"Executive summary generation failed: {e}")
             return f"This week's Global Pulse covers {len(articles)} articles and reports from {len(by_category)} categories across {date_range}."
@@ -490,30 +894,59 @@ WRITING STYLE:
         score = 3  # Base score
         
         # Source importance boost
-        critical_sources = ['Fed', 'ECB', 'RBI', 'IMF', 'World Bank', 'BoE', 'BoJ', 'PBoC']
-        high_sources = ['OECD', 'WEF', 'BIS', 'McKinsey', 'Goldman Sachs', 'JP Morgan']
-        
-        if article.source in critical_sources:
+        if article.source in self.CRITICAL_SOURCES:
             score += 3
-        elif article.source in high_sources:
+        elif article.source in self.HIGH_SOURCES:
             score += 2
         
         # Content type boost
-        if article.content_type in ['report', 'data_release', 'speech']:
+        if article.content_type in self.MAJOR_CONTENT_TYPES:
             score += 2
-        elif article.content_type in ['working_paper', 'expert_opinion']:
+        elif article.content_type in self.MINOR_CONTENT_TYPES:
             score += 1
         
         # Keyword boost - market-moving content
-        title_lower = article.title.lower()
-        critical_keywords = ['rate decision', 'fomc', 'mpc', 'gdp', 'inflation', 'recession', 
-                           'crisis', 'emergency', 'downgrade', 'upgrade', 'outlook']
-        if any(kw in title_lower for kw in critical_keywords):
+        if self._critical_keyword_pattern.search(self._lowered(article)[0]):
             score += 2
         
         # Cap at 10
         return min(score, 10)
     
+    def _score_articles(self, articles: list[Article]) -> None:
+        """
+        Vectorized _calculate_importance over a whole batch.
+        
+        Sources, content types and keyword hits are laid out as parallel
+        arrays so every boost is a single NumPy mask operation; scores and
+        levels are written back onto the articles.
+        """
+        if not articles:
+            return
+        
+        sources = np.array([a.source for a in articles])
+        content_types = np.array([a.content_type for a in articles])
+        keyword_hits = np.fromiter(
+            (bool(self._critical_keyword_pattern.search(self._lowered(a)[0])) for a in articles),
+            dtype=bool, count=len(articles)
+        )
+        
+        scores = np.full(len(articles), 3, dtype=np.int64)
+        
+        critical = np.isin(sources, self.CRITICAL_SOURCES)
+        scores += 3 * critical
+        scores += 2 * (np.isin(sources, self.HIGH_SOURCES) & ~critical)
+        
+        major = np.isin(content_types, self.MAJOR_CONTENT_TYPES)
+        scores += 2 * major
+        scores += np.isin(content_types, self.MINOR_CONTENT_TYPES) & ~major
+        
+        scores += 2 * keyword_hits
+        np.minimum(scores, 10, out=scores)
+        
+        for article, score in zip(articles, scores.tolist()):
+            article.importance_score = score
+            article.importance_level = self._get_importance_level(score)
+    
     def _get_importance_level(self, score: int) -> str:
         """Convert numeric score to importance level."""
         if score >= 8:
@@ -526,35 +959,18 @@ WRITING STYLE:
     def _assign_themes(self, article: Article) -> list[str]:
         """Assign thematic tags to an article for grouping."""
         themes = []
-        combined = f"{article.title} {article.summary}".lower()
-        
-        theme_keywords = {
-            'Monetary Policy': ['interest rate', 'central bank', 'monetary policy', 'repo rate', 
-                               'fed', 'ecb', 'fomc', 'mpc', 'quantitative'],
-            'Inflation': ['inflation', 'cpi', 'price index', 'deflation', 'stagflation'],
-            'Growth & GDP': ['gdp', 'growth', 'recession', 'expansion', 'economic outlook'],
-            'Employment': ['employment', 'unemployment', 'jobs', 'labor', 'wage', 'workforce'],
-            'Trade': ['trade', 'tariff', 'export', 'import', 'wto', 'trade war', 'protectionism'],
-            'Fiscal Policy': ['budget', 'fiscal', 'government spending', 'taxation', 'deficit'],
-            'Financial Stability': ['financial stability', 'systemic risk', 'banking crisis', 'stress test'],
-            'Currency & Forex': ['currency', 'forex', 'exchange rate', 'dollar', 'yuan', 'rupee'],
-            'Debt & Credit': ['debt', 'credit', 'bond', 'yield', 'sovereign debt', 'credit rating'],
-            'Technology & AI': ['technology', 'digital', 'ai', 'fintech', 'cryptocurrency'],
-            'Climate & ESG': ['climate', 'esg', 'sustainable', 'green', 'carbon', 'net zero'],
-            'Emerging Markets': ['emerging market', 'developing', 'brics', 'frontier market'],
-        }
+        _, _, combined = self._lowered(article)
         
-        for theme, keywords in theme_keywords.items():
-            if any(kw in combined for kw in keywords):
+        for theme, pattern in _THEME_PATTERNS.items():
+            if pattern.search(combined):
                 themes.append(theme)
         
         return themes if themes else ['General Economic']
     
     def generate_top5_tldr(self, articles: list[Article]) -> str:
         """Generate TL;DR Top 5 section with the most critical developments."""
-        # Sort by importance score
-        sorted_articles = sorted(articles, key=lambda x: x.importance_score, reverse=True)
-        top_5 = sorted_articles[:5]
+        # Highest importance scores (partial selection, no full sort)
+        top_5 = heapq.nlargest(5, articles, key=attrgetter('importance_score'))
         
         if not top_5:
             return "No critical developments this week."
@@ -581,42 +997,38 @@ Be specific. No jargon. Maximum 20 words per explanation.
 If you don't have the specific data, keep it general but accurate."""
 
         try:
-            self._check_rate_limit()
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached_generate(prompt, stream=True).strip()
         except Exception as e:
             logger.error(f"TL;DR generation failed: {e}")
             # Fallback
             return "\n".join([f"• [{a.source}] {a.title}" for a in top_5])
     
-    def generate_cross_source_synthesis(self, articles: list[Article]) -> str:
+    def generate_cross_source_synthesis(self, articles: list[Article],
+                                        indexes: Optional[dict] = None) -> str:
         """Generate cross-source synthesis identifying trends across organizations."""
         # Group by theme
-        theme_articles = {}
-        for article in articles:
-            for theme in article.themes:
-                if theme not in theme_articles:
-                    theme_articles[theme] = []
-                theme_articles[theme].append(article)
+        indexes = indexes or self._build_indexes(articles)
+        theme_articles = indexes['by_theme']
+        theme_sources = indexes['theme_sources']
         
         # Find themes with multiple sources
         multi_source_themes = {
             theme: arts for theme, arts in theme_articles.items() 
-            if len(set(a.source for a in arts)) >= 2
+            if len(theme_sources[theme]) >= 2
         }
         
         if not multi_source_themes:
             return "Limited cross-source patterns identified this week."
         
         theme_summary = "\n".join([
-            f"- {theme}: {len(arts)} items from {len(set(a.source for a in arts))} sources"
-            for theme, arts in sorted(multi_source_themes.items(), key=lambda x: -len(x[1]))[:5]
+            f"- {theme}: {len(arts)} items from {len(theme_sources[theme])} sources"
+            for theme, arts in sorted(multi_source_themes.items(), key=lambda x: len(x[1]), reverse=True)[:5]
         ])
         
         # Identify consensus/divergence
         sources_summary = []
         for theme, arts in list(multi_source_themes.items())[:3]:
-            sources = list(set(a.source for a in arts))[:4]
+            sources = list(theme_sources[theme])[:4]
             titles = [a.title[:50] for a in arts[:3]]
             sources_summary.append(f"{theme}:\n  Sources: {', '.join(sources)}\n  Headlines: {'; '.join(titles)}")
         
@@ -638,37 +1050,26 @@ Format with bold headers. Be specific about which organizations agree/disagree.
 If you don't have enough detail, say "Based on available headlines..." and keep it accurate."""
 
         try:
-            self._check_rate_limit()
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached_generate(prompt, stream=True).strip()
         except Exception as e:
             logger.error(f"Cross-source synthesis failed: {e}")
-            return f"This week saw coverage from {len(set(a.source for a in articles))} organizations across {len(theme_articles)} themes."
+            return f"This week saw coverage from {len(indexes['by_source'])} organizations across {len(theme_articles)} themes."
     
-    def generate_theme_summary(self, articles: list[Article]) -> dict[str, str]:
+    def generate_theme_summary(self, articles: list[Article],
+                               indexes: Optional[dict] = None) -> dict[str, str]:
         """Generate summaries for each major theme."""
-        theme_articles = {}
-        for article in articles:
-            for theme in article.themes:
-                if theme not in theme_articles:
-                    theme_articles[theme] = []
-                theme_articles[theme].append(article)
+        indexes = indexes or self._build_indexes(articles)
+        theme_sources = indexes['theme_sources']
         
-        summaries = {}
-        for theme, arts in sorted(theme_articles.items(), key=lambda x: -len(x[1])):
-            if len(arts) < 2:
-                continue
-            
-            sources = list(set(a.source for a in arts))
-            headlines = [a.title for a in arts[:5]]
-            
-            summaries[theme] = {
+        return {
+            theme: {
                 'count': len(arts),
-                'sources': sources,
-                'headlines': headlines
+                'sources': list(theme_sources[theme]),
+                'headlines': [a.title for a in arts[:5]]
             }
-        
-        return summaries
+            for theme, arts in sorted(indexes['by_theme'].items(), key=lambda x: len(x[1]), reverse=True)
+            if len(arts) >= 2
+        }
     
     def generate_sentiment_analysis(self, articles: list[Article]) -> str:
         """Generate overall market/economic sentiment analysis."""
@@ -696,9 +1097,7 @@ Provide a SENTIMENT ANALYSIS section (100-150 words) with:
 Be specific. Base conclusions ONLY on the headlines provided. Don't guess."""
 
         try:
-            self._check_rate_limit()
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached_generate(prompt, stream=True).strip()
         except Exception as e:
             logger.error(f"Sentiment analysis failed: {e}")
             return "Sentiment analysis unavailable this week."
@@ -706,7 +1105,7 @@ Be specific. Base conclusions ONLY on the headlines provided. Don't guess."""
     def generate_actionable_implications(self, articles: list[Article]) -> str:
         """Generate actionable implications for different stakeholders."""
         # Get top articles by importance
-        top_articles = sorted(articles, key=lambda x: x.importance_score, reverse=True)[:10]
+        top_articles = heapq.nlargest(10, articles, key=attrgetter('importance_score'))
         summaries = [f"[{a.source}] {a.title}: {a.ai_summary or a.summary[:100]}" for a in top_articles]
         
         prompt = f"""Based on this week's key economic developments, provide ACTIONABLE IMPLICATIONS.
@@ -736,117 +1135,98 @@ CRITICAL RULES:
 - Do NOT give financial advice, frame as considerations"""
 
         try:
-            self._check_rate_limit()
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._cached_generate(prompt, stream=True).strip()
         except Exception as e:
             logger.error(f"Implications generation failed: {e}")
             return "Implications section unavailable this week."
     
-    def generate_geographic_summary(self, articles: list[Article]) -> dict:
+    def generate_geographic_summary(self, articles: list[Article],
+                                    indexes: Optional[dict] = None) -> dict:
         """Group articles by geographic region."""
-        # Define region mappings
-        source_regions = {
-            # Americas
-            'Fed': 'Americas', 'NBER': 'Americas', 'Brookings': 'Americas', 'PIIE': 'Americas',
-            'WSJ': 'Americas', 'Goldman Sachs': 'Americas', 'JP Morgan': 'Americas',
-            # Europe
-            'ECB': 'Europe', 'BoE': 'Europe', 'Bruegel': 'Europe', 'FT': 'Europe',
-            # Asia-Pacific
-            'BoJ': 'Asia-Pacific', 'PBoC': 'Asia-Pacific', 'ADB': 'Asia-Pacific',
-            # India-specific
-            'RBI': 'India', 'MoF India': 'India', 'MoSPI': 'India', 'NITI Aayog': 'India',
-            # Global/International
-            'IMF': 'Global', 'World Bank': 'Global', 'OECD': 'Global', 'WTO': 'Global',
-            'WEF': 'Global', 'BIS': 'Global', 'ILO': 'Global', 'UNCTAD': 'Global',
-            # Consulting (Global)
-            'McKinsey': 'Global', 'Deloitte': 'Global', 'BCG': 'Global', 'PwC': 'Global',
-        }
-        
-        regions = {
-            'Global': {'articles': [], 'sources': set()},
-            'Americas': {'articles': [], 'sources': set()},
-            'Europe': {'articles': [], 'sources': set()},
-            'Asia-Pacific': {'articles': [], 'sources': set()},
-            'India': {'articles': [], 'sources': set()},
-        }
-        
-        for article in articles:
-            region = source_regions.get(article.source, 'Global')
-            if region in regions:
-                regions[region]['articles'].append(article)
-                regions[region]['sources'].add(article.source)
-        
-        # Convert sets to lists and add counts
-        for region in regions:
-            regions[region]['sources'] = list(regions[region]['sources'])
-            regions[region]['count'] = len(regions[region]['articles'])
-            regions[region]['headlines'] = [a.title for a in regions[region]['articles'][:5]]
+        indexes = indexes or self._build_indexes(articles)
+        
+        regions = {}
+        for region, group in indexes['by_region'].items():
+            regions[region] = {
+                'articles': group['articles'],
+                'sources': list(group['sources']),
+                'count': len(group['articles']),
+                'headlines': [a.title for a in group['articles'][:5]],
+            }
         
         return regions
     
-    def fetch_key_economic_indicators(self) -> dict:
-        """Fetch key economic indicators from free APIs."""
-        indicators = {}
+    def _build_indexes(self, articles: list[Article]) -> dict:
+        """
+        Group articles by theme, category, region and source in one pass.
         
-        try:
-            import requests
-            
-            # FRED API (Federal Reserve Economic Data) - Free, no key required for basic
-            fred_series = {
-                'US_INFLATION': 'CPIAUCSL',      # US CPI
-                'US_UNEMPLOYMENT': 'UNRATE',     # US Unemployment Rate
-                'US_GDP_GROWTH': 'A191RL1Q225SBEA',  # US Real GDP Growth
-                'FED_FUNDS_RATE': 'FEDFUNDS',    # Federal Funds Rate
-            }
+        The report sections all need some of these groupings; building them
+        once per run avoids re-walking the article list in every section.
+        
+        Returns:
+            Dict with by_theme, theme_sources, by_category, by_region and by_source
+        """
+        by_theme = defaultdict(list)
+        theme_sources = defaultdict(set)
+        by_category = defaultdict(list)
+        by_region = {region: {'articles': [], 'sources': set()} for region in self.REGIONS}
+        by_source = defaultdict(list)
+        
+        for article in articles:
+            for theme in article.themes:
+                by_theme[theme].append(article)
+                theme_sources[theme].add(article.source)
             
-            for name, series_id in fred_series.items():
-                try:
-                    url = f"https://api.stlouisfed.org/fred/series/observations?series_id={series_id}&api_key=demo&file_type=json&limit=1&sort_order=desc"
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('observations'):
-                            obs = data['observations'][0]
-                            indicators[name] = {
-                                'value': obs.get('value', 'N/A'),
-                                'date': obs.get('date', 'N/A')
-                            }
-                except Exception as e:
-                    logger.debug(f"Could not fetch {name}: {e}")
+            by_category[article.ai_category or article.category].append(article.title)
             
-            # Add placeholder for other indicators
-            indicators['NOTES'] = "Data from FRED (Federal Reserve Economic Data). For more indicators, add API keys."
+            region = self.SOURCE_REGIONS.get(article.source, 'Global')
+            if region in by_region:
+                by_region[region]['articles'].append(article)
+                by_region[region]['sources'].add(article.source)
             
-        except Exception as e:
-            logger.error(f"Error fetching economic indicators: {e}")
-            indicators['error'] = str(e)
-        
-        return indicators
+            by_source[article.source].append(article)
+        
+        return {
+            'by_theme': by_theme,
+            'theme_sources': theme_sources,
+            'by_category': by_category,
+            'by_region': by_region,
+            'by_source': by_source,
+        }
     
-    def generate_key_numbers_section(self, indicators: dict) -> str:
-        """Generate a Key Numbers This Week section."""
-        if not indicators or 'error' in indicators:
-            return "Key economic indicators unavailable. Check API connectivity."
+    def generate_all_sections(self, articles: list[Article], date_range: str) -> dict[str, str]:
+        """
+        Generate the independent AI report sections concurrently.
         
-        lines = ["**KEY ECONOMIC NUMBERS**\n"]
+        The five sections share no data, so they run on a small thread pool
+        instead of back-to-back; the shared rate limiter still paces the calls.
         
-        indicator_names = {
-            'US_INFLATION': 'US Inflation (CPI)',
-            'US_UNEMPLOYMENT': 'US Unemployment Rate',
-            'US_GDP_GROWTH': 'US GDP Growth (Q/Q)',
-            'FED_FUNDS_RATE': 'Fed Funds Rate',
+        Returns:
+            Dict with executive_summary, top5_tldr, cross_source,
+            sentiment and implications text
+        """
+        indexes = self._build_indexes(articles)
+        tasks = {
+            'executive_summary': lambda: self.generate_executive_summary(articles, date_range, indexes),
+            'top5_tldr': lambda: self.generate_top5_tldr(articles),
+            'cross_source': lambda: self.generate_cross_source_synthesis(articles, indexes),
+            'sentiment': lambda: self.generate_sentiment_analysis(articles),
+            'implications': lambda: self.generate_actionable_implications(articles),
         }
         
-        for key, name in indicator_names.items():
-            if key in indicators:
-                val = indicators[key]
-                lines.append(f"• {name}: {val['value']}% (as of {val['date']})")
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
         
-        if indicators.get('NOTES'):
-            lines.append(f"\n_{indicators['NOTES']}_")
-        
-        return "\n".join(lines)
+        # Each generate_* method already falls back on its own errors
+        return {name: future.result() for name, future in futures.items()}
+    
+    def fetch_key_economic_indicators(self) -> dict:
+        """Fetch key economic indicators from free APIs."""
+        return self.indicators.get()
+    
+    def generate_key_numbers_section(self, indicators: dict) -> str:
+        """Generate a Key Numbers This Week section."""
+        return format_key_numbers(indicators)
     
     # =========================================================================
     # DEEP PDF ANALYSIS METHODS
@@ -948,7 +1328,7 @@ TEXT:
 Provide a concise summary (100-150 words):"""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             self._mark_success()
             return response.text.strip()
         except Exception as e:
@@ -1004,7 +1384,7 @@ RULES:
 - Use bullet points for readability"""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             self._mark_success()
             return response.text.strip()
         except Exception as e:
@@ -1043,7 +1423,7 @@ Describe this chart in 2-3 sentences:
 
 Be specific about any numbers, percentages, or trends you can identify."""
 
-            response = self.model.generate_content([prompt, img])
+            response = self._generate([prompt, img])
             self._mark_success()
             return response.text.strip()
             
@@ -1068,7 +1448,7 @@ Be specific about any numbers, percentages, or trends you can identify."""
 Write a single-sentence summary (max 150 characters) capturing the most important finding:"""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             self._mark_success()
             summary = response.text.strip()
             return summary[:200]
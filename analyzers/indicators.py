@@ -0,0 +1,145 @@
+"""
+Economic Indicators - Key FRED series shared by all analyzers.
+Fetching and formatting need no AI, so every analyzer delegates to the same
+provider and formatter instead of keeping its own copy.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from analyzers import fast_json
+from analyzers.llm_cache import FileCache
+from config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# FRED observations endpoint; only series_id and api_key vary per request
+FRED_URL = "https://api.stlouisfed.org/fred/series/observations"
+FRED_PARAMS = {'file_type': 'json', 'limit': 1, 'sort_order': 'desc'}
+FRED_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+# Indicator key -> FRED series id
+FRED_SERIES = {
+    'US_INFLATION': 'CPIAUCSL',          # US CPI
+    'US_UNEMPLOYMENT': 'UNRATE',         # US Unemployment Rate
+    'US_GDP_GROWTH': 'A191RL1Q225SBEA',  # US Real GDP Growth
+    'FED_FUNDS_RATE': 'FEDFUNDS',        # Federal Funds Rate
+}
+
+# Indicator key -> label in the Key Numbers section
+INDICATOR_NAMES = {
+    'US_INFLATION': 'US Inflation (CPI)',
+    'US_UNEMPLOYMENT': 'US Unemployment Rate',
+    'US_GDP_GROWTH': 'US GDP Growth (Q/Q)',
+    'FED_FUNDS_RATE': 'Fed Funds Rate',
+}
+
+
+class FredIndicators:
+    """
+    Latest observations of the key FRED series.
+
+    Series are fetched in parallel over a pooled session and cached on disk
+    for a day (they update monthly at most). The result is also kept in
+    memory, so analyzers sharing one provider fetch FRED once per run.
+    """
+
+    CACHE_TTL = 86400  # Seconds an observation stays valid
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 cache: Optional[FileCache] = None):
+        """
+        Args:
+            session: HTTP session to use (a pooled one is created if omitted)
+            cache: On-disk cache for observations (defaults to Settings.CACHE_DIR)
+        """
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': Settings.USER_AGENT})
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504),
+                          raise_on_status=False)
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=len(FRED_SERIES),
+                                                  max_retries=retry))
+        self.session = session
+        self.cache = cache or FileCache(Settings.CACHE_DIR)
+        self._indicators: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> dict:
+        """
+        Return the indicators dict.
+
+        Returns:
+            {key: {'value', 'date'}} for each series that could be fetched, plus
+            'NOTES'; or {'error': message} if the fetch failed outright
+        """
+        with self._lock:
+            if self._indicators is None:
+                self._indicators = self._fetch_all()
+            return dict(self._indicators)
+
+    def _fetch_all(self) -> dict:
+        """Fetch every series in parallel; each task writes its own key."""
+        indicators = {}
+        try:
+            with ThreadPoolExecutor(max_workers=len(FRED_SERIES)) as executor:
+                futures = {
+                    executor.submit(self._fetch_series, name, series_id): name
+                    for name, series_id in FRED_SERIES.items()
+                }
+                for future in as_completed(futures):
+                    observation = future.result()
+                    if observation:
+                        indicators[futures[future]] = observation
+
+            indicators['NOTES'] = "Data from FRED (Federal Reserve Economic Data)."
+        except Exception as e:
+            logger.error(f"Error fetching economic indicators: {e}")
+            indicators = {'error': str(e)}
+
+        return indicators
+
+    def _fetch_series(self, name: str, series_id: str) -> Optional[dict]:
+        """Fetch the latest observation of one FRED series (None on failure)."""
+        cached = self.cache.get('fred', series_id, ttl=self.CACHE_TTL)
+        if cached is not None:
+            return cached
+        try:
+            params = dict(FRED_PARAMS, series_id=series_id, api_key=Settings.FRED_API_KEY or 'demo')
+            response = self.session.get(FRED_URL, params=params, timeout=FRED_TIMEOUT)
+            if response.status_code == 200:
+                data = fast_json.loads(response.content)
+                if data.get('observations'):
+                    obs = data['observations'][0]
+                    observation = {
+                        'value': obs.get('value', 'N/A'),
+                        'date': obs.get('date', 'N/A')
+                    }
+                    self.cache.set('fred', series_id, observation)
+                    return observation
+        except Exception as e:
+            logger.debug(f"Could not fetch {name}: {e}")
+        return None
+
+
+def format_key_numbers(indicators: Optional[dict]) -> str:
+    """Render the Key Numbers section from a FredIndicators.get() dict."""
+    if not indicators or 'error' in indicators:
+        return "Key economic indicators unavailable. Check API connectivity."
+
+    lines = ["**KEY ECONOMIC NUMBERS**\n"]
+    for key, name in INDICATOR_NAMES.items():
+        if key in indicators:
+            val = indicators[key]
+            lines.append(f"• {name}: {val['value']}% (as of {val['date']})")
+
+    if indicators.get('NOTES'):
+        lines.append(f"\n_{indicators['NOTES']}_")
+
+    return "\n".join(lines)
@@ -0,0 +1,253 @@
+"""
+LLM Cache - Persistent caches for AI-generated text.
+Lets reruns and near-duplicate articles reuse earlier model output instead
+of paying for another API call.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write JSON to a temp file and swap it in so a crash never truncates the cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class ExactCache:
+    """
+    Bounded LRU cache of exact key -> JSON-serializable value.
+
+    Used for prompt -> response text (prompts are fully determined by
+    their inputs) and article URL -> stored analysis, so a rerun over the
+    same articles can be answered from disk without any API calls.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 10_000):
+        """
+        Args:
+            path: JSON file the cache is persisted to
+            max_entries: Least recently used entries are evicted past this size
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def key(prompt: str) -> str:
+        """Cache key for a prompt."""
+        return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+    def load(self):
+        """Load entries from disk."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = OrderedDict(json.load(f))
+            logger.info(f"[CACHE] Loaded {len(self.entries)} exact cache entries")
+        except Exception as e:
+            logger.warning(f"[CACHE] Could not load {self.path.name}: {e}")
+            self.entries = OrderedDict()
+
+    def save(self):
+        """Persist the cache if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                _write_json_atomic(self.path, self.entries)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"[CACHE] Could not save {self.path.name}: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None."""
+        with self._lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._dirty = True
+
+
+class SemanticCache:
+    """
+    Embedding-keyed cache for article summaries and analyses.
+
+    The same report is often syndicated by several outlets with slightly
+    different titles, so lookups match on cosine similarity of the
+    (title + summary) embedding rather than on exact text.
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.92, ttl_days: int = 7):
+        """
+        Args:
+            path: JSON file the cache is persisted to
+            threshold: Minimum cosine similarity that counts as a hit
+            ttl_days: Entries older than this are discarded
+        """
+        self.path = Path(path)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_days * 86400
+        self.entries: list[dict] = []
+        self.hits = 0
+        self.misses = 0
+        self._matrix = None  # Row-normalized embeddings, rebuilt lazily
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load unexpired entries from disk."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            cutoff = time.time() - self.ttl_seconds
+            self.entries = [e for e in entries if e.get('created', 0) >= cutoff]
+            logger.info(f"[CACHE] Loaded {len(self.entries)} semantic cache entries")
+        except Exception as e:
+            logger.warning(f"[CACHE] Could not load {self.path.name}: {e}")
+            self.entries = []
+
+    def save(self):
+        """Persist the cache if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                _write_json_atomic(self.path, self.entries)
+                self._dirty = False
+            except Exception as e:
+                logger.warning(f"[CACHE] Could not save {self.path.name}: {e}")
+
+    def lookup(self, embedding: list[float]) -> Optional[dict]:
+        """
+        Find the closest cached entry.
+
+        Returns:
+            The cached entry dict if its similarity clears the threshold, else None
+        """
+        with self._lock:
+            if not self.entries:
+                self.misses += 1
+                return None
+
+            if self._matrix is None:
+                matrix = np.asarray([e['embedding'] for e in self.entries], dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                self._matrix = matrix / np.where(norms == 0, 1, norms)
+
+            query = np.asarray(embedding, dtype=np.float32)
+            query_norm = np.linalg.norm(query)
+            if query_norm == 0:
+                self.misses += 1
+                return None
+
+            similarities = self._matrix @ (query / query_norm)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                self.hits += 1
+                return self.entries[best]
+
+            self.misses += 1
+            return None
+
+    def add(self, embedding: list[float], summary: str = "", analysis: str = "") -> dict:
+        """Store a new entry and return it."""
+        entry = {
+            'embedding': list(embedding),
+            'summary': summary,
+            'analysis': analysis,
+            'created': time.time(),
+        }
+        with self._lock:
+            self.entries.append(entry)
+            self._matrix = None
+            self._dirty = True
+        return entry
+
+    def update(self, entry: dict, **values):
+        """Fill in fields (e.g. a later analysis) on an existing entry."""
+        with self._lock:
+            entry.update(values)
+            self._dirty = True
+
+
+class FileCache:
+    """
+    One-file-per-entry cache with a time-to-live.
+
+    Suited to slowly changing remote data (FRED series update monthly at
+    most) and to completions that are fetched one at a time, where loading
+    and rewriting a single large JSON file per call would be wasteful.
+    Entries live under ``<root>/<namespace>/<blake2b(key)>.json``.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root: Directory holding one subdirectory per namespace
+        """
+        self.root = Path(root)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.root / namespace / f"{digest}.json"
+
+    def get(self, namespace: str, key: str, ttl: float) -> Optional[Any]:
+        """
+        Return the cached value if it is younger than ``ttl`` seconds, else None.
+        """
+        path = self._path(namespace, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"[CACHE] Unreadable entry {path.name}: {e}")
+            return None
+
+        if time.time() - entry.get('ts', 0) > ttl:
+            return None
+        return entry.get('value')
+
+    def set(self, namespace: str, key: str, value: Any):
+        """Store a JSON-serializable value."""
+        try:
+            _write_json_atomic(self._path(namespace, key), {'ts': time.time(), 'value': value})
+        except Exception as e:
+            logger.warning(f"[CACHE] Could not write {namespace} entry: {e}")
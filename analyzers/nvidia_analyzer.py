@@ -12,6 +12,7 @@ Models:
 """
 
 import logging
+import re
 import time
 import base64
 import requests as http_requests
@@ -20,11 +21,38 @@ from collections.abc import Iterable
 
 from openai import OpenAI
 
+from analyzers.indicators import FredIndicators, format_key_numbers
+from analyzers.themes import THEME_KEYWORDS
 from collectors.base_collector import Article
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Regular inflections a theme keyword may carry and still match as a word
+KEYWORD_SUFFIXES = r"(?:s|es|ed|ing|er|ers)?"
+
+
+def _keyword_labeler(groups: dict) -> tuple[re.Pattern, dict[str, list[str]]]:
+    """
+    Build a single-pass whole-word matcher for {label: keywords}.
+
+    Returns a case-insensitive pattern whose group 1 is the matched keyword
+    and a keyword -> labels index, so one finditer over the text yields every
+    label. A keyword may carry one of KEYWORD_SUFFIXES ("exports",
+    "exporting", "growers") but must otherwise be a whole word, so "ai"
+    never fires inside "said", nor "import" inside "important". Irregular
+    forms ("currencies", "trading") are listed in the keyword table itself.
+    """
+    index = {}
+    for label, keywords in groups.items():
+        for kw in keywords:
+            index.setdefault(kw, []).append(label)
+    alternation = "|".join(re.escape(kw) for kw in sorted(index, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)({alternation}){KEYWORD_SUFFIXES}(?!\w)", re.IGNORECASE), index
+
+
+_THEME_PATTERN, _THEME_INDEX = _keyword_labeler(THEME_KEYWORDS)
+
 
 # =========================================================================
 # MODEL CONFIGURATION
@@ -50,8 +78,13 @@ class NvidiaAnalyzer:
     Drop-in replacement for GeminiAnalyzer with the same public API.
     """
 
-    def __init__(self):
-        """Initialize the NVIDIA NIM analyzer with all model clients."""
+    def __init__(self, indicators: Optional[FredIndicators] = None):
+        """
+        Initialize the NVIDIA NIM analyzer with all model clients.
+
+        Args:
+            indicators: Shared FRED provider (one is created if omitted)
+        """
         if not Settings.NVIDIA_API_KEY:
             raise ValueError("NVIDIA_API_KEY not set in environment")
 
@@ -79,6 +112,9 @@ class NvidiaAnalyzer:
         self.max_consecutive_errors = 5
         self.quota_exhausted = False
 
+        # Key economic numbers come from FRED, no AI needed
+        self.indicators = indicators or FredIndicators()
+
         logger.info(f"NVIDIA NIM Analyzer initialized with 7-model architecture")
         logger.info(f"  🟢 Summarizer:  {NvidiaModels.SUMMARIZER}")
         logger.info(f"  🔵 Analyzer:    {NvidiaModels.DEEP_ANALYZER}")
@@ -239,7 +275,7 @@ class NvidiaAnalyzer:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{b64_image}"
+                                "url": f"data:image/jpeg;base64,{b64_image}"
                             }
                         }
                     ]
@@ -1318,59 +1354,11 @@ RULES:
 
     def fetch_key_economic_indicators(self) -> dict:
         """Fetch key economic indicators from free APIs."""
-        indicators = {}
-        try:
-            fred_series = {
-                'US_INFLATION': 'CPIAUCSL',
-                'US_UNEMPLOYMENT': 'UNRATE',
-                'US_GDP_GROWTH': 'A191RL1Q225SBEA',
-                'FED_FUNDS_RATE': 'FEDFUNDS',
-            }
-
-            for name, series_id in fred_series.items():
-                try:
-                    url = f"https://api.stlouisfed.org/fred/series/observations?series_id={series_id}&api_key=demo&file_type=json&limit=1&sort_order=desc"
-                    response = http_requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('observations'):
-                            obs = data['observations'][0]
-                            indicators[name] = {
-                                'value': obs.get('value', 'N/A'),
-                                'date': obs.get('date', 'N/A')
-                            }
-                except Exception as e:
-                    logger.debug(f"Could not fetch {name}: {e}")
-
-            indicators['NOTES'] = "Data from FRED (Federal Reserve Economic Data)."
-        except Exception as e:
-            logger.error(f"Error fetching economic indicators: {e}")
-            indicators['error'] = str(e)
-
-        return indicators
+        return self.indicators.get()
 
     def generate_key_numbers_section(self, indicators: dict) -> str:
         """Generate a Key Numbers section."""
-        if not indicators or 'error' in indicators:
-            return "Key economic indicators unavailable. Check API connectivity."
-
-        lines = ["**KEY ECONOMIC NUMBERS**\n"]
-        indicator_names = {
-            'US_INFLATION': 'US Inflation (CPI)',
-            'US_UNEMPLOYMENT': 'US Unemployment Rate',
-            'US_GDP_GROWTH': 'US GDP Growth (Q/Q)',
-            'FED_FUNDS_RATE': 'Fed Funds Rate',
-        }
-
-        for key, name in indicator_names.items():
-            if key in indicators:
-                val = indicators[key]
-                lines.append(f"• {name}: {val['value']}% (as of {val['date']})")
-
-        if indicators.get('NOTES'):
-            lines.append(f"\n_{indicators['NOTES']}_")
-
-        return "\n".join(lines)
+        return format_key_numbers(indicators)
 
     # =====================================================================
     # DEEP PDF ANALYSIS (Models 2, 3, 6)
@@ -1617,27 +1605,12 @@ Write a single-sentence summary (max 150 characters) capturing the most importan
 
     def _assign_themes(self, article: Article) -> list[str]:
         """Assign thematic tags to an article."""
-        themes = []
-        combined = f"{article.title} {article.summary}".lower()
-
-        theme_keywords = {
-            'Monetary Policy': ['interest rate', 'central bank', 'monetary policy', 'repo rate',
-                               'fed', 'ecb', 'fomc', 'mpc', 'quantitative'],
-            'Inflation': ['inflation', 'cpi', 'price index', 'deflation', 'stagflation'],
-            'Growth & GDP': ['gdp', 'growth', 'recession', 'expansion', 'economic outlook'],
-            'Employment': ['employment', 'unemployment', 'jobs', 'labor', 'wage', 'workforce'],
-            'Trade': ['trade', 'tariff', 'export', 'import', 'wto', 'trade war', 'protectionism'],
-            'Fiscal Policy': ['budget', 'fiscal', 'government spending', 'taxation', 'deficit'],
-            'Financial Stability': ['financial stability', 'systemic risk', 'banking crisis', 'stress test'],
-            'Currency & Forex': ['currency', 'forex', 'exchange rate', 'dollar', 'yuan', 'rupee'],
-            'Debt & Credit': ['debt', 'credit', 'bond', 'yield', 'sovereign debt', 'credit rating'],
-            'Technology & AI': ['technology', 'digital', 'ai', 'fintech', 'cryptocurrency'],
-            'Climate & ESG': ['climate', 'esg', 'sustainable', 'green', 'carbon', 'net zero'],
-            'Emerging Markets': ['emerging market', 'developing', 'brics', 'frontier market'],
+        combined = f"{article.title} {article.summary or ''}"
+        found = {
+            theme
+            for match in _THEME_PATTERN.finditer(combined)
+            for theme in _THEME_INDEX[match.group(1).lower()]
         }
-
-        for theme, keywords in theme_keywords.items():
-            if any(kw in combined for kw in keywords):
-                themes.append(theme)
-
+        # Keep the declaration order of THEME_KEYWORDS
+        themes = [theme for theme in THEME_KEYWORDS if theme in found]
         return themes if themes else ['General Economic']
@@ -3,49 +3,156 @@ OpenRouter Analyzer - Multi-model AI analysis using OpenRouter API.
 Provides access to Llama, Mistral, Gemma and other free models.
 """
 
+import hashlib
+import json
 import logging
+import re
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import NamedTuple, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from config import Settings
+from analyzers import fast_json
+from analyzers.indicators import FredIndicators, format_key_numbers
+from analyzers.llm_cache import FileCache
+from analyzers.rate_limiter import TokenBucket
 from collectors.base_collector import Article
 
 logger = logging.getLogger(__name__)
 
 
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _token_set(text: str) -> frozenset[str]:
+    """
+    Searchable terms of lowercase text.
+    
+    Besides the word tokens, the set holds their singular forms ("rates" ->
+    "rate") and adjacent-word pairs ("central bank", "u s"), so multi-word
+    keywords are found with the same set lookup as single words.
+    """
+    tokens = TOKEN_PATTERN.findall(text)
+    singulars = [t[:-1] if len(t) > 2 and t.endswith('s') else t for t in tokens]
+    terms = set(tokens)
+    terms.update(singulars)
+    terms.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    terms.update(f"{a} {b}" for a, b in zip(tokens, singulars[1:]))
+    return frozenset(terms)
+
+
+def _keyword_sets(groups: dict) -> dict[str, frozenset[str]]:
+    """Normalize {group: keywords} into {group: frozenset} of terms comparable with _token_set."""
+    return {
+        group: frozenset(" ".join(TOKEN_PATTERN.findall(kw.lower())) for kw in keywords)
+        for group, keywords in groups.items()
+    }
+
+
+class FreeModel(NamedTuple):
+    """A free OpenRouter model and what it is best suited for."""
+    id: str
+    name: str
+    context: int
+    best_for: str
+
+
 class OpenRouterAnalyzer:
     """AI analyzer using OpenRouter API with multiple free models."""
     
+    COMPLETION_CACHE_TTL = 7 * 86400  # Seconds a cached completion stays valid
+    REQUEST_TIMEOUT = (3.05, 57)  # (connect, read) seconds: fail fast on dead hosts, allow slow generations
+    
+    # Weekly brief sections, in prompt order: marker -> instructions
+    BRIEF_SECTIONS = {
+        "EXEC": """Write a 200-word executive summary covering:
+- Major economic developments
+- Key policy changes
+- Market trends
+- Risks and opportunities""",
+        "TLDR": """Identify the TOP 5 most important developments. For each, provide a priority
+indicator (CRITICAL/IMPORTANT/NOTABLE) and a one-sentence explanation, formatted as:
+1. [CRITICAL] Development - Brief explanation
+2. [IMPORTANT] Development - Brief explanation
+... etc""",
+        "SENTIMENT": """Analyze the overall market sentiment. Provide:
+1. OVERALL SENTIMENT: BULLISH / NEUTRAL / BEARISH
+2. Confidence level (High/Medium/Low)
+3. Key factors driving sentiment
+4. Sector breakdown (which sectors bullish/bearish)""",
+        "SYNTHESIS": """Compare the sources and find:
+1. COMMON THEMES across different organizations
+2. CONTRASTING VIEWS where sources disagree
+3. EMERGING CONSENSUS on key issues""",
+        "IMPL": """Provide specific, actionable insights for:
+1. INVESTORS: What should they watch/consider?
+2. BUSINESSES: What strategic adjustments to consider?
+3. POLICYMAKERS: What policy responses might be needed?
+4. CONSUMERS: How might this affect household decisions?""",
+    }
+    SECTION_SPLIT_PATTERN = re.compile(r"===SECTION:(\w+)===")
+    
+    # Keyword groups for the local (no-API) theme and region breakdowns
+    THEME_KEYWORDS = {
+        "Monetary Policy": ['rate', 'fed', 'central bank', 'monetary', 'interest', 'ecb', 'boe'],
+        "Trade & Tariffs": ['trade', 'tariff', 'export', 'import', 'wto'],
+        "Inflation": ['inflation', 'cpi', 'price', 'deflation'],
+        "Employment": ['job', 'employment', 'unemployment', 'labor', 'wage', 'workforce'],
+        "Growth & GDP": ['gdp', 'growth', 'recession', 'expansion', 'economic'],
+        "Financial Markets": ['stock', 'bond', 'equity', 'market', 'investor', 'banking'],
+        "Technology & AI": ['ai', 'tech', 'technology', 'digital', 'artificial', 'automation'],
+        "Energy & Climate": ['energy', 'oil', 'climate', 'carbon', 'renewable']
+    }
+    REGION_KEYWORDS = {
+        "Global": ["global", "world", "imf", "worldbank", "wto", "g20", "g7", "oecd"],
+        "Americas": ["us", "u.s.", "usa", "america", "fed", "treasury", "washington", "canada", "brazil", "mexico"],
+        "Europe": ["europe", "eu", "ecb", "eurozone", "uk", "britain", "germany", "france", "boe"],
+        "Asia-Pacific": ["china", "japan", "india", "asia", "pacific", "asean", "korea", "pboc", "boj"],
+        "India": ["india", "rbi", "niti", "mospi", "rupee", "sensex", "nifty"]
+    }
+    THEME_SETS = _keyword_sets(THEME_KEYWORDS)
+    REGION_SETS = _keyword_sets(REGION_KEYWORDS)
+    
     # Free models in order of preference - verified working as of Jan 2026
-    FREE_MODELS = [
-        {
-            "id": "meta-llama/llama-3.3-70b-instruct:free",
-            "name": "Llama 3.3 70B",
-            "context": 131072,
-            "best_for": "Complex analysis, reasoning"
-        },
-        {
-            "id": "google/gemma-3-27b-it:free",
-            "name": "Gemma 3 27B",
-            "context": 128000,
-            "best_for": "Multilingual, reasoning"
-        },
-        {
-            "id": "google/gemma-3-12b-it:free",
-            "name": "Gemma 3 12B",
-            "context": 128000,
-            "best_for": "Fast, multimodal"
-        },
-        {
-            "id": "meta-llama/llama-3.2-3b-instruct:free",
-            "name": "Llama 3.2 3B",
-            "context": 131072,
-            "best_for": "Simple summaries"
-        }
-    ]
+    FREE_MODELS = (
+        FreeModel(
+            id="meta-llama/llama-3.3-70b-instruct:free",
+            name="Llama 3.3 70B",
+            context=131072,
+            best_for="Complex analysis, reasoning"
+        ),
+        FreeModel(
+            id="google/gemma-3-27b-it:free",
+            name="Gemma 3 27B",
+            context=128000,
+            best_for="Multilingual, reasoning"
+        ),
+        FreeModel(
+            id="google/gemma-3-12b-it:free",
+            name="Gemma 3 12B",
+            context=128000,
+            best_for="Fast, multimodal"
+        ),
+        FreeModel(
+            id="meta-llama/llama-3.2-3b-instruct:free",
+            name="Llama 3.2 3B",
+            context=131072,
+            best_for="Simple summaries"
+        ),
+    )
     
-    def __init__(self, api_key: str = None):
-        """Initialize OpenRouter analyzer."""
+    def __init__(self, api_key: str = None, indicators: Optional[FredIndicators] = None):
+        """
+        Initialize OpenRouter analyzer.
+        
+        Args:
+            api_key: OpenRouter key (defaults to Settings.OPENROUTER_API_KEY)
+            indicators: Shared FRED provider (one is created if omitted)
+        """
         self.api_key = api_key or Settings.OPENROUTER_API_KEY
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not set")
@@ -59,12 +166,38 @@ class OpenRouterAnalyzer:
             "X-Title": "Economic Intelligence Agent"
         }
         
-        # Rate limiting
+        # Pooled session: reuses the TLS connection across calls and sizes the
+        # pool for the concurrent summary workers. Transient gateway errors are
+        # retried by urllib3; 429s are left to _call_api, which switches models.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET", "POST"),
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        
+        # Completions are cached on disk so reruns over the same articles are free
+        self.cache = FileCache(Settings.CACHE_DIR)
+        
+        # Key economic numbers come from FRED, no AI needed
+        self.indicators = indicators or FredIndicators(cache=self.cache)
+        
+        # Parsed weekly briefs keyed by the article set, so the five section
+        # methods share a single API call
+        self._weekly_brief_cache = {}
+        self._token_cache = None  # (article URLs, token sets) shared by the classifiers
+        
+        # Rate limiting - token bucket refilling at the free-tier per-minute rate
         self.requests_per_minute = 15
-        self.request_count = 0
-        self.last_reset = time.time()
-        self.min_delay = 3
-        self.last_request = 0
+        self.rate_limiter = TokenBucket(
+            capacity=self.requests_per_minute,
+            refill_rate=self.requests_per_minute / 60,
+            name="OPENROUTER"
+        )
         
         # Quota tracking
         self.consecutive_errors = 0
@@ -72,9 +205,13 @@ class OpenRouterAnalyzer:
         self.quota_exhausted = False
         self.successful_requests = 0
         self.failed_requests = 0
+        
+        # Summaries can be generated from worker threads (generate_summaries_batch);
+        # the bucket is thread-safe, the counters are guarded here
+        self._stats_lock = threading.Lock()
     
     @property
-    def current_model(self):
+    def current_model(self) -> FreeModel:
         """Get the current model being used."""
         return self.FREE_MODELS[self.current_model_index]
     
@@ -82,27 +219,7 @@ class OpenRouterAnalyzer:
         """Enforce rate limiting."""
         if self.quota_exhausted:
             return False
-        
-        # Minimum delay between requests
-        elapsed = time.time() - self.last_request
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        
-        # Per-minute rate limit
-        if time.time() - self.last_reset > 60:
-            self.request_count = 0
-            self.last_reset = time.time()
-        
-        if self.request_count >= self.requests_per_minute:
-            wait = 65 - (time.time() - self.last_reset)
-            if wait > 0:
-                logger.info(f"Rate limit reached, waiting {wait:.1f}s")
-                time.sleep(wait)
-            self.request_count = 0
-            self.last_reset = time.time()
-        
-        self.request_count += 1
-        self.last_request = time.time()
+        self.rate_limiter.consume()
         return True
     
     def _switch_model(self):
@@ -111,64 +228,123 @@ class OpenRouterAnalyzer:
             self.current_model_index += 1
             self.consecutive_errors = 0
             logger.warning(
-                f"Switching to model: {self.current_model['name']} "
-                f"({self.current_model['id']})"
+                f"Switching to model: {self.current_model.name} "
+                f"({self.current_model.id})"
             )
             return True
         return False
     
-    def _call_api(self, messages: list, max_tokens: int = 1000) -> Optional[str]:
-        """Make API call to OpenRouter."""
-        if not self._rate_limit():
-            return None
-        
-        payload = {
-            "model": self.current_model["id"],
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": 0.7
-        }
-        
-        try:
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                json=payload,
-                timeout=60
-            )
+    def _call_api(self, messages: list, max_tokens: int = 1000, stream: bool = False,
+                  max_chars: Optional[int] = None) -> Optional[str]:
+        """
+        Make API call to OpenRouter.
+        
+        Args:
+            messages: Chat messages
+            max_tokens: Generation limit
+            stream: Read the completion as server-sent events as it is generated
+            max_chars: With stream, stop reading once this much text has arrived
+        """
+        cache_key = hashlib.sha256(
+            (self.current_model.id + str(max_tokens) + str(max_chars) + json.dumps(messages)).encode('utf-8')
+        ).hexdigest()
+        cached = self.cache.get("openrouter", cache_key, ttl=self.COMPLETION_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        # Every model gets max_consecutive_errors tries before the next one is used
+        max_attempts = self.max_consecutive_errors * len(self.FREE_MODELS)
+        for attempt in range(max_attempts):
+            if not self._rate_limit():
+                return None
+            
+            payload = {
+                "model": self.current_model.id,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": 0.7
+            }
+            if stream:
+                payload["stream"] = True
+            
+            try:
+                response = self.session.post(
+                    self.base_url,
+                    data=fast_json.dumps(payload),
+                    stream=stream,
+                    timeout=self.REQUEST_TIMEOUT
+                )
+            except Exception as e:
+                logger.error(f"Request error: {e}")
+                with self._stats_lock:
+                    self.failed_requests += 1
+                return None
             
             if response.status_code == 200:
-                data = response.json()
-                self.consecutive_errors = 0
-                self.successful_requests += 1
-                return data["choices"][0]["message"]["content"]
+                try:
+                    if stream:
+                        content = self._read_stream(response, max_chars)
+                    else:
+                        content = fast_json.loads(response.content)["choices"][0]["message"]["content"]
+                except Exception as e:
+                    logger.error(f"Unexpected response format: {e}")
+                    with self._stats_lock:
+                        self.failed_requests += 1
+                    return None
+                with self._stats_lock:
+                    self.consecutive_errors = 0
+                    self.successful_requests += 1
+                if content:
+                    self.cache.set("openrouter", cache_key, content)
+                return content
+            
+            # Error responses are never streamed to a reader; release the pooled connection
+            with response:
+                if response.status_code != 429:
+                    logger.error(f"API error {response.status_code}: {response.text}")
+                    with self._stats_lock:
+                        self.failed_requests += 1
+                    return None
             
-            elif response.status_code == 429:
+            with self._stats_lock:
                 self.consecutive_errors += 1
                 self.failed_requests += 1
+                error_count = self.consecutive_errors
                 logger.warning(
-                    f"Rate limit on {self.current_model['name']}: "
-                    f"error {self.consecutive_errors}/{self.max_consecutive_errors}"
+                    f"Rate limit on {self.current_model.name}: "
+                    f"error {error_count}/{self.max_consecutive_errors}"
                 )
                 
-                if self.consecutive_errors >= self.max_consecutive_errors:
+                if error_count >= self.max_consecutive_errors:
                     if not self._switch_model():
                         self.quota_exhausted = True
                         logger.error("=== ALL MODELS EXHAUSTED ===")
                         return None
-                
-                time.sleep(30 * self.consecutive_errors)
-                return self._call_api(messages, max_tokens)
             
-            else:
-                logger.error(f"API error {response.status_code}: {response.text}")
-                self.failed_requests += 1
-                return None
-                
-        except Exception as e:
-            logger.error(f"Request error: {e}")
-            self.failed_requests += 1
-            return None
+            if attempt < max_attempts - 1:
+                time.sleep(30 * error_count)
+        
+        return None
+    
+    @staticmethod
+    def _read_stream(response: requests.Response, max_chars: Optional[int] = None) -> str:
+        """Accumulate a streamed completion, stopping early once max_chars have arrived."""
+        parts = []
+        length = 0
+        with response:
+            for line in response.iter_lines():
+                # Skip blank separators and ": OPENROUTER PROCESSING" keep-alives
+                if not line.startswith(b"data: "):
+                    continue
+                data = line[6:]
+                if data == b"[DONE]":
+                    break
+                delta = fast_json.loads(data)["choices"][0].get("delta", {}).get("content") or ""
+                parts.append(delta)
+                length += len(delta)
+                if max_chars and length >= max_chars:
+                    break
+        return "".join(parts)
     
     def generate_summary(self, article: Article) -> str:
         """Generate a one-liner summary for an article."""
@@ -184,12 +360,34 @@ Content: {article.summary or article.content_preview[:500] if article.content_pr
 One-sentence summary:"""
         
         messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=100)
+        result = self._call_api(messages, max_tokens=100, stream=True, max_chars=200)
         
         if result:
             return result.strip()[:200]
         return article.summary[:150] if article.summary else "Summary unavailable"
     
+    def generate_summaries_batch(self, articles: list[Article],
+                                 max_concurrent: Optional[int] = None) -> list[str]:
+        """
+        Generate one-liner summaries for many articles concurrently.
+        
+        Each call is network-bound, so a few requests are kept in flight at
+        once; the shared rate limiter still enforces the per-minute ceiling.
+        
+        Args:
+            articles: Articles to summarize
+            max_concurrent: Parallel requests (default: a quarter of the per-minute limit)
+        
+        Returns:
+            Summaries in the same order as the articles
+        """
+        if not articles:
+            return []
+        
+        workers = max_concurrent or max(1, self.requests_per_minute // 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.generate_summary, articles))
+    
     def generate_analysis(self, article: Article) -> str:
         """Generate detailed analysis for important articles."""
         if self.quota_exhausted:
@@ -207,243 +405,219 @@ Content: {article.summary or article.content_preview[:1000] if article.content_p
 Analysis:"""
         
         messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=500)
+        result = self._call_api(messages, max_tokens=500, stream=True)
         
         return result or ""
     
-    def generate_executive_summary(self, articles: list[Article], date_range: str) -> str:
-        """Generate executive summary of all articles."""
+    def generate_weekly_brief(self, articles: list[Article], date_range: str = "") -> dict[str, str]:
+        """
+        Generate all five weekly brief sections with a single API call.
+        
+        The section methods below all work from the same article digest, so
+        asking for them together charges the rate limiter once and sends the
+        digest once. The parsed result (or failure) is memoized per article set
+        and date range.
+        
+        Args:
+            articles: Analyzed articles for the week
+            date_range: Period label used in the prompt
+        
+        Returns:
+            Dict of section marker (EXEC, TLDR, SENTIMENT, SYNTHESIS, IMPL) -> text;
+            empty if the call failed
+        """
         if self.quota_exhausted or not articles:
-            return f"Weekly economic intelligence covering {len(articles)} articles."
+            return {}
+        
+        cache_key = (tuple(a.url for a in articles), date_range)
+        if cache_key in self._weekly_brief_cache:
+            return self._weekly_brief_cache[cache_key]
         
-        # Prepare article digest
-        digest = []
-        for i, article in enumerate(articles[:30]):  # Top 30 articles
-            digest.append(f"{i+1}. [{article.source}] {article.title}")
+        digest = self._digest(articles, 30)
+        
+        # Group by source for the cross-source section
+        by_source = {}
+        for a in islice(articles, 30):
+            by_source.setdefault(a.source, []).append(a.title)
+        source_summary = "\n".join(
+            f"{source}: {', '.join(titles[:3])}"
+            for source, titles in islice(by_source.items(), 10)
+        )
+        
+        sections = "\n\n".join(
+            f"===SECTION:{marker}===\n{instructions}"
+            for marker, instructions in self.BRIEF_SECTIONS.items()
+        )
+        period = f" from {date_range}" if date_range else ""
         
         prompt = f"""You are an expert economist writing a weekly intelligence brief.
 
-Based on these {len(articles)} articles from {date_range}, write an executive summary:
+Based on these {len(articles)} articles{period}:
 
-{chr(10).join(digest)}
+{digest}
 
-Write a 200-word executive summary covering:
-- Major economic developments
-- Key policy changes
-- Market trends
-- Risks and opportunities
+Sources and their articles:
+{source_summary}
+
+Write each of the following sections. Start every section with its marker line
+exactly as shown (e.g. ===SECTION:EXEC===) and do not add any other markers.
 
-Executive Summary:"""
+{sections}"""
         
         messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=400)
-        
-        return result or f"Weekly economic intelligence covering {len(articles)} articles."
-    
-    def generate_tldr_top5(self, articles: list[Article]) -> str:
-        """Generate TL;DR Top 5 developments."""
-        if self.quota_exhausted or not articles:
-            return ""
-        
-        digest = []
-        for i, a in enumerate(articles[:20]):
-            digest.append(f"{i+1}. [{a.source}] {a.title}")
+        result = self._call_api(messages, max_tokens=1800)
+        if not result:
+            # Remember the failure too, so the other sections don't repeat the call
+            self._weekly_brief_cache[cache_key] = {}
+            return {}
         
-        prompt = f"""From these articles, identify the TOP 5 most important developments.
-For each, provide:
-- Priority indicator (CRITICAL/IMPORTANT/NOTABLE)
-- One-sentence explanation
-
-Articles:
-{chr(10).join(digest)}
-
-Format:
-1. [CRITICAL] Development - Brief explanation
-2. [IMPORTANT] Development - Brief explanation
-... etc
-
-TOP 5:"""
+        # re.split with a capture group yields [preamble, name, body, name, body, ...]
+        parts = self.SECTION_SPLIT_PATTERN.split(result)
+        brief = {
+            name.upper(): body.strip()
+            for name, body in zip(parts[1::2], parts[2::2])
+            if name.upper() in self.BRIEF_SECTIONS
+        }
+        if not brief:
+            logger.warning("Weekly brief response had no section markers")
         
-        messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=400)
+        self._weekly_brief_cache[cache_key] = brief
+        return brief
+    
+    @staticmethod
+    def _digest(articles: list[Article], n: int) -> str:
+        """Numbered "[source] title" lines for the top n articles."""
+        return "\n".join(f"{i+1}. [{a.source}] {a.title}" for i, a in enumerate(islice(articles, n)))
+    
+    def generate_all_sections(self, articles: list[Article], date_range: str) -> dict[str, str]:
+        """
+        Generate the AI report sections, checking the quota once up front.
+        
+        Once every model is exhausted the placeholders are returned directly,
+        without building digests or prompts that would only be discarded.
+        
+        Returns:
+            Dict with executive_summary, top5_tldr, cross_source,
+            sentiment and implications text
+        """
+        if self.is_degraded() or not articles:
+            return {
+                'executive_summary': f"Weekly economic intelligence covering {len(articles)} articles.",
+                'top5_tldr': "",
+                'cross_source': "",
+                'sentiment': "",
+                'implications': "",
+            }
         
-        return result or ""
+        return {
+            'executive_summary': self.generate_executive_summary(articles, date_range),
+            'top5_tldr': self.generate_tldr_top5(articles, date_range),
+            'cross_source': self.generate_cross_source_synthesis(articles, date_range),
+            'sentiment': self.generate_sentiment(articles, date_range),
+            'implications': self.generate_actionable_implications(articles, date_range),
+        }
+    
+    def generate_executive_summary(self, articles: list[Article], date_range: str) -> str:
+        """Generate executive summary of all articles."""
+        brief = self.generate_weekly_brief(articles, date_range)
+        return brief.get("EXEC") or f"Weekly economic intelligence covering {len(articles)} articles."
     
-    def generate_sentiment(self, articles: list[Article]) -> str:
+    def generate_tldr_top5(self, articles: list[Article], date_range: str = "") -> str:
+        """Generate TL;DR Top 5 developments."""
+        return self.generate_weekly_brief(articles, date_range).get("TLDR", "")
+    
+    def generate_sentiment(self, articles: list[Article], date_range: str = "") -> str:
         """Generate market sentiment analysis."""
-        if self.quota_exhausted or not articles:
-            return ""
-        
-        digest = [f"- [{a.source}] {a.title}" for a in articles[:25]]
-        
-        prompt = f"""Analyze the overall market sentiment from these economic articles:
-
-{chr(10).join(digest)}
-
-Provide:
-1. OVERALL SENTIMENT: BULLISH / NEUTRAL / BEARISH
-2. Confidence level (High/Medium/Low)
-3. Key factors driving sentiment
-4. Sector breakdown (which sectors bullish/bearish)
-
-Sentiment Analysis:"""
-        
-        messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=400)
-        
-        return result or ""
+        return self.generate_weekly_brief(articles, date_range).get("SENTIMENT", "")
     
-    def generate_cross_source_synthesis(self, articles: list[Article]) -> str:
+    def generate_cross_source_synthesis(self, articles: list[Article], date_range: str = "") -> str:
         """Generate cross-source synthesis finding common themes."""
-        if self.quota_exhausted or not articles:
-            return ""
-        
-        # Group by source
-        by_source = {}
-        for a in articles[:30]:
-            if a.source not in by_source:
-                by_source[a.source] = []
-            by_source[a.source].append(a.title)
-        
-        source_summary = []
-        for source, titles in list(by_source.items())[:10]:
-            source_summary.append(f"{source}: {', '.join(titles[:3])}")
-        
-        prompt = f"""Analyze these articles from multiple sources and find:
-1. COMMON THEMES across different organizations
-2. CONTRASTING VIEWS where sources disagree
-3. EMERGING CONSENSUS on key issues
-
-Sources and their articles:
-{chr(10).join(source_summary)}
-
-Cross-Source Synthesis:"""
-        
-        messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=500)
-        
-        return result or ""
+        return self.generate_weekly_brief(articles, date_range).get("SYNTHESIS", "")
     
     def generate_theme_summary(self, articles: list[Article]) -> dict:
         """Generate theme-based summary of articles in format expected by document_generator."""
         if not articles:
             return {}
-        
-        # Define theme keywords
-        theme_keywords = {
-            "Monetary Policy": ['rate', 'fed', 'central bank', 'monetary', 'interest', 'ecb', 'boe'],
-            "Trade & Tariffs": ['trade', 'tariff', 'export', 'import', 'wto'],
-            "Inflation": ['inflation', 'cpi', 'price', 'deflation'],
-            "Employment": ['job', 'employment', 'unemployment', 'labor', 'wage', 'workforce'],
-            "Growth & GDP": ['gdp', 'growth', 'recession', 'expansion', 'economic'],
-            "Financial Markets": ['stock', 'bond', 'equity', 'market', 'investor', 'banking'],
-            "Technology & AI": ['ai', 'tech', 'digital', 'artificial', 'automation'],
-            "Energy & Climate": ['energy', 'oil', 'climate', 'carbon', 'renewable']
-        }
-        
-        # Build result with format: {theme: {count, sources, headlines}}
+        return self._group_articles(articles, self._token_sets(articles), self.THEME_SETS)
+    
+    @staticmethod
+    def _lc(article: Article) -> str:
+        """
+        Lowercase title + summary, computed once per article.
+        
+        Stored on the Article's cached-text fields so the theme and region
+        classifiers (and the other analyzers) share one lowercasing pass.
+        """
+        if not article._combined_lower:
+            article._title_lower = article.title.lower()
+            article._summary_lower = (article.summary or '').lower()
+            article._combined_lower = f"{article._title_lower} {article._summary_lower}"
+        return article._combined_lower
+    
+    def _token_sets(self, articles: list[Article]) -> list[frozenset[str]]:
+        """Token set of each article's title + summary, built once per article set."""
+        key = tuple(a.url for a in articles)
+        cached = self._token_cache
+        if cached and cached[0] == key:
+            return cached[1]
+        token_sets = [_token_set(self._lc(a)) for a in articles]
+        self._token_cache = (key, token_sets)
+        return token_sets
+    
+    @staticmethod
+    def _group_articles(articles: list[Article], token_sets: list[frozenset[str]],
+                        keyword_sets: dict[str, frozenset[str]]) -> dict:
+        """
+        Bucket articles by keyword group with one set-disjointness check per group.
+        
+        Returns:
+            {group: {count, sources, headlines}} for groups with any match,
+            in keyword_sets order
+        """
         result = {}
-        for theme, keywords in theme_keywords.items():
-            theme_articles = []
-            theme_sources = set()
-            
-            for article in articles:
-                text = f"{article.title} {article.summary or ''}".lower()
-                if any(kw in text for kw in keywords):
-                    theme_articles.append(article.title)
-                    theme_sources.add(article.source)
-            
-            if theme_articles:
-                result[theme] = {
-                    'count': len(theme_articles),
-                    'sources': list(theme_sources)[:5],
-                    'headlines': theme_articles[:5]
+        for group, keywords in keyword_sets.items():
+            matched = [a for a, tokens in zip(articles, token_sets) if not tokens.isdisjoint(keywords)]
+            if matched:
+                result[group] = {
+                    'count': len(matched),
+                    'sources': list(islice({a.source for a in matched}, 5)),
+                    'headlines': [a.title for a in islice(matched, 5)]
                 }
-        
         return result
     
-    def generate_actionable_implications(self, articles: list[Article]) -> str:
+    def generate_actionable_implications(self, articles: list[Article], date_range: str = "") -> str:
         """Generate actionable implications from the articles."""
-        if self.quota_exhausted or not articles:
-            return ""
-        
-        digest = [f"- [{a.source}] {a.title}" for a in articles[:20]]
-        
-        prompt = f"""Based on these economic articles, provide ACTIONABLE IMPLICATIONS for:
-
-Articles:
-{chr(10).join(digest)}
-
-Provide specific, actionable insights for:
-1. INVESTORS: What should they watch/consider?
-2. BUSINESSES: What strategic adjustments to consider?
-3. POLICYMAKERS: What policy responses might be needed?
-4. CONSUMERS: How might this affect household decisions?
-
-Actionable Implications:"""
-        
-        messages = [{"role": "user", "content": prompt}]
-        result = self._call_api(messages, max_tokens=500)
-        
-        return result or ""
+        return self.generate_weekly_brief(articles, date_range).get("IMPL", "")
     
     def generate_geographic_summary(self, articles: list[Article]) -> dict:
         """Generate geographic breakdown of articles in format expected by document_generator."""
         if not articles:
             return {}
         
-        # Define regions
-        regions = {
-            "Global": ["global", "world", "imf", "worldbank", "wto", "g20", "g7", "oecd"],
-            "Americas": ["us", "usa", "america", "fed", "treasury", "washington", "canada", "brazil", "mexico"],
-            "Europe": ["europe", "eu", "ecb", "eurozone", "uk", "britain", "germany", "france", "boe"],
-            "Asia-Pacific": ["china", "japan", "india", "asia", "pacific", "asean", "korea", "pboc", "boj"],
-            "India": ["india", "rbi", "niti", "mospi", "rupee", "sensex", "nifty"]
-        }
-        
-        # Build result with format: {region: {count, sources, headlines}}
-        result = {}
-        for region, keywords in regions.items():
-            region_articles = []
-            region_sources = set()
-            
-            for article in articles:
-                text = f"{article.title} {article.source} {article.summary or ''}".lower()
-                if any(kw in text for kw in keywords):
-                    region_articles.append(article.title)
-                    region_sources.add(article.source)
-            
-            if region_articles:
-                result[region] = {
-                    'count': len(region_articles),
-                    'sources': list(region_sources)[:5],
-                    'headlines': region_articles[:5]
-                }
-        
-        return result
+        # Regions also count the publishing source (e.g. "World Bank", "RBI")
+        token_sets = [
+            tokens | _token_set(a.source.lower())
+            for a, tokens in zip(articles, self._token_sets(articles))
+        ]
+        return self._group_articles(articles, token_sets, self.REGION_SETS)
     
     def generate_key_numbers_section(self, indicators: dict = None) -> str:
-        """Generate key numbers section (placeholder for FRED data)."""
-        if not indicators:
-            return "Key economic indicators will be updated when data is available."
-        
-        # Format any indicators that were passed
-        lines = ["Key Economic Indicators:"]
-        for name, value in indicators.items():
-            lines.append(f"- {name}: {value}")
-        return "\n".join(lines)
+        """Generate a Key Numbers section."""
+        return format_key_numbers(indicators)
     
     def fetch_key_economic_indicators(self) -> dict:
-        """Placeholder for FRED API integration."""
-        # This would normally call FRED API
-        # For now, return empty dict - actual data comes from GeminiAnalyzer
-        return {}
+        """Fetch key economic indicators from free APIs."""
+        return self.indicators.get()
+    
+    def is_degraded(self) -> bool:
+        """True once all free models are exhausted and AI sections fall back to placeholders."""
+        return self.quota_exhausted
     
     def get_status(self) -> dict:
         """Get current analyzer status."""
         return {
-            "current_model": self.current_model["name"],
-            "model_id": self.current_model["id"],
+            "current_model": self.current_model.name,
+            "model_id": self.current_model.id,
             "successful_requests": self.successful_requests,
             "failed_requests": self.failed_requests,
             "quota_exhausted": self.quota_exhausted,
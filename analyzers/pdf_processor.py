@@ -4,7 +4,7 @@ PDF Processor - Downloads and extracts content from PDF reports.
 Handles:
 - PDF downloading with caching
 - Full text extraction using PyMuPDF
-- Table extraction using pdfplumber
+- Table extraction using PyMuPDF's table finder
 - Image/chart extraction for vision analysis
 - Document chunking for efficient LLM processing
 """
@@ -12,24 +12,62 @@ Handles:
 import os
 import re
 import logging
+import sqlite3
+import threading
 import tempfile
 import hashlib
+import time
+from bisect import bisect_right
 from pathlib import Path
 from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from io import BytesIO
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import fitz  # PyMuPDF
-import pdfplumber
-from PIL import Image
 
+from analyzers import fast_json
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# RE2 matches in linear time with no backtracking; the patterns below use
+# only syntax both engines accept, so the stdlib engine is a drop-in fallback
+try:
+    import re2 as _stat_regex
+except ImportError:
+    _stat_regex = re
 
-@dataclass
+# Patterns for common statistics (see extract_key_statistics)
+_STAT_PATTERNS = tuple(_stat_regex.compile(f'(?i){p}') for p in (
+    # Percentages
+    r'(\d+(?:\.\d+)?)\s*(?:percent|%)',
+    # Dollar amounts
+    r'\$\s*(\d+(?:\.\d+)?)\s*(?:billion|million|trillion|B|M|T)',
+    # Growth rates
+    r'(?:grew|growth|increase|decline|fell|rose)\s+(?:by\s+)?(\d+(?:\.\d+)?)\s*%',
+    # Year-over-year
+    r'(\d+(?:\.\d+)?)\s*%\s*(?:YoY|year-over-year|y/y)',
+    # Basis points
+    r'(\d+)\s*(?:basis points|bps)',
+    # GDP figures
+    r'GDP.{1,30}?(\d+(?:\.\d+)?)\s*%',
+    # Unemployment
+    r'unemployment.{1,20}?(\d+(?:\.\d+)?)\s*%',
+    # Inflation
+    r'inflation.{1,20}?(\d+(?:\.\d+)?)\s*%',
+))
+_WHITESPACE = re.compile(r'\s+')
+
+# Chunk boundaries; lookaheads so overlapping runs ('\n\n\n') yield every position
+_PARAGRAPH_BREAK = re.compile(r'(?=\n\n)')
+_SENTENCE_BREAK = re.compile(r'(?=\. )')
+
+
+@dataclass(slots=True)
 class ExtractedContent:
     """Container for extracted PDF content."""
     full_text: str = ""
@@ -43,6 +81,86 @@ class ExtractedContent:
     error_message: str = ""
 
 
+# Vision models accept at most ~1568px per side; larger images are downscaled
+# and everything is re-encoded as JPEG before it is kept in memory
+VISION_MAX_SIDE = 1568
+VISION_JPEG_QUALITY = 85
+
+
+def _normalize_image(image_bytes: bytes) -> Optional[bytes]:
+    """
+    Fit an extracted image within VISION_MAX_SIDE and re-encode it as JPEG.
+    
+    Returns:
+        JPEG bytes, or None if the data is not a decodable image
+    """
+    from PIL import Image, UnidentifiedImageError  # Only needed once a PDF has charts
+    
+    try:
+        with Image.open(BytesIO(image_bytes)) as img:
+            img.thumbnail((VISION_MAX_SIDE, VISION_MAX_SIDE), Image.LANCZOS)
+            buffer = BytesIO()
+            img.convert('RGB').save(buffer, 'JPEG', quality=VISION_JPEG_QUALITY, optimize=True)
+            return buffer.getvalue()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        return None
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int, max_images: int,
+                        max_tables: int) -> list[tuple[int, str, list[bytes], list[list]]]:
+    """
+    Extract text, significant images and tables from pages [start, stop).
+    
+    Module-level so it can run in a worker process; each call opens its own
+    document handle.
+    
+    Returns:
+        (page number, text, images, tables) per page, where each table is a
+        list of rows; images and tables stop being collected once max_images /
+        max_tables have been gathered in this range
+    """
+    pages = []
+    image_count = 0
+    table_count = 0
+    with fitz.open(pdf_path) as doc:
+        for page_num in range(start, stop):
+            page = doc[page_num]
+            text = page.get_text()
+            
+            images = []
+            if image_count < max_images:
+                for img in page.get_images(full=True):
+                    try:
+                        # The stored stream length is a cheap proxy for the size; only
+                        # images that could pass the size filter get extracted
+                        length_type, length = doc.xref_get_key(img[0], 'Length')
+                        if length_type == 'int' and int(length) <= 10240:
+                            continue
+                        image_bytes = doc.extract_image(img[0])["image"]
+                        # Only keep images larger than 10KB (likely charts/graphs)
+                        if len(image_bytes) > 10240:
+                            normalized = _normalize_image(image_bytes)
+                            if normalized:
+                                images.append(normalized)
+                    except Exception:
+                        continue
+                image_count += len(images)
+            
+            tables = []
+            if table_count < max_tables:
+                try:
+                    for table in page.find_tables().tables:
+                        rows = table.extract()
+                        if rows and len(rows) > 1:  # Must have at least header + 1 row
+                            tables.append(rows)
+                except Exception:
+                    pass
+                table_count += len(tables)
+            
+            pages.append((page_num, text, images, tables))
+    return pages
+
+
 class PDFProcessor:
     """
     Processes PDF documents for deep analysis.
@@ -77,13 +195,52 @@ class PDFProcessor:
         'monitor', 'update', 'economic', 'financial stability'
     ]
     
+    # Lookup forms of the lists above, built once at class load
+    _PRIORITY_SOURCES = frozenset(DEEP_ANALYSIS_SOURCES)
+    _DEEP_TYPES = frozenset(DEEP_ANALYSIS_TYPES)
+    _KEYWORDS_RE = re.compile('|'.join(map(re.escape, IMPORTANT_KEYWORDS)), re.IGNORECASE)
+    _PDF_URL_RE = re.compile(r'\.pdf$|/pdf/|download|publication', re.IGNORECASE)
+    
+    # Bytes read per chunk when streaming a download to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    
+    # Larger downloads are skipped (checked via HEAD, and again while streaming)
+    MAX_PDF_BYTES = 100 * 1024 * 1024
+    
+    # Page extraction: image/table caps, and when/how to split across processes
+    MAX_IMAGES = 10
+    MAX_TABLES = 20
+    PARALLEL_PAGE_THRESHOLD = 16
+    PAGES_PER_SHARD = 8
+    
     def __init__(self, cache_dir: Path = None):
         """Initialize PDF processor with cache directory."""
         self.cache_dir = cache_dir or (Settings.BASE_DIR / 'cache' / 'pdfs')
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Track processed PDFs to avoid duplicates
-        self.processed_urls = set()
+        # Pooled session: many PDFs come from the same few hosts (imf.org,
+        # bis.org, federalreserve.gov), so connections are reused across downloads
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Track processed PDFs (by URL digest) to avoid duplicates this run
+        self.processed_urls: set[bytes] = set()
+        
+        # Persistent URL digest -> file index, so later runs skip the network
+        self._index = self._open_index()
+        
+        # Files are stored by content hash, so mirrored PDFs share one file
+        # and one extraction: (content hash, max_pages) -> ExtractedContent
+        self.extraction_cache: dict[tuple[str, int], ExtractedContent] = {}
         
         # Statistics
         self.stats = {
@@ -92,6 +249,48 @@ class PDFProcessor:
             'failed': 0,
             'skipped': 0
         }
+        
+        # Downloads run on worker threads (download_many)
+        self._lock = threading.Lock()
+    
+    def _open_index(self) -> Optional[sqlite3.Connection]:
+        """Open (or create) the download index; None if SQLite is unusable."""
+        try:
+            conn = sqlite3.connect(self.cache_dir / 'index.sqlite', check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS urls('
+                'hash BLOB PRIMARY KEY, path TEXT, size INTEGER, fetched_at INTEGER)'
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"PDF index unavailable, PDFs will not be reused across runs: {e}")
+            return None
+    
+    def _indexed_path(self, url_hash: bytes) -> Optional[Path]:
+        """Return the indexed file for a URL digest if it is still on disk."""
+        if self._index is None:
+            return None
+        with self._lock:
+            row = self._index.execute('SELECT path FROM urls WHERE hash = ?', (url_hash,)).fetchone()
+        if row and os.path.exists(row[0]):
+            return Path(row[0])
+        return None
+    
+    def _index_download(self, url_hash: bytes, path: Path, size: int):
+        """Record a finished download in the index."""
+        if self._index is None:
+            return
+        try:
+            with self._lock:
+                self._index.execute(
+                    'INSERT OR REPLACE INTO urls VALUES (?, ?, ?, ?)',
+                    (url_hash, str(path), size, int(time.time()))
+                )
+                self._index.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update PDF index: {e}")
     
     def should_deep_analyze(self, article) -> bool:
         """
@@ -103,27 +302,16 @@ class PDFProcessor:
         Returns:
             True if article warrants deep analysis
         """
-        # Check if source is in our priority list
-        is_priority_source = article.source in self.DEEP_ANALYSIS_SOURCES
-        
-        # Check content type
-        is_report_type = article.content_type in self.DEEP_ANALYSIS_TYPES
-        
-        # Check for important keywords in title
-        title_lower = article.title.lower()
-        has_important_keywords = any(kw in title_lower for kw in self.IMPORTANT_KEYWORDS)
-        
-        # Check if URL might be a PDF
-        url_lower = article.url.lower()
-        likely_pdf = (
-            url_lower.endswith('.pdf') or 
-            '/pdf/' in url_lower or
-            'download' in url_lower or
-            'publication' in url_lower
-        )
+        # Must be a priority source - the common "no" needs no string work
+        if article.source not in self._PRIORITY_SOURCES:
+            return False
         
-        # Decision logic: must be priority source AND (report type OR important keywords)
-        return is_priority_source and (is_report_type or has_important_keywords or likely_pdf)
+        # ...and a report type, an important title, or a likely PDF URL
+        if article.content_type in self._DEEP_TYPES:
+            return True
+        if self._KEYWORDS_RE.search(article.title):
+            return True
+        return self._PDF_URL_RE.search(article.url) is not None
     
     def download_pdf(self, url: str, timeout: int = 30) -> Optional[Path]:
         """
@@ -136,58 +324,146 @@ class PDFProcessor:
         Returns:
             Path to downloaded file or None if failed
         """
-        if url in self.processed_urls:
+        url_hash = hashlib.blake2b(url.encode(), digest_size=8).digest()
+        if url_hash in self.processed_urls:
             logger.debug(f"Already processed: {url}")
             return None
         
         try:
-            # Generate cache filename from URL hash
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-            cache_path = self.cache_dir / f"{url_hash}.pdf"
-            
-            # Check if already cached
-            if cache_path.exists():
+            # Check if already downloaded, in this or an earlier run
+            cache_path = self._indexed_path(url_hash)
+            if cache_path is not None:
                 logger.debug(f"Using cached PDF: {cache_path}")
-                self.processed_urls.add(url)
+                with self._lock:
+                    self.processed_urls.add(url_hash)
                 return cache_path
             
-            # Download the PDF
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            # A HEAD request rules out landing pages and huge files before any body is sent
+            if not self._head_looks_downloadable(url, timeout):
+                self._count('skipped')
+                return None
             
-            response = requests.get(url, headers=headers, timeout=timeout, stream=True)
-            response.raise_for_status()
+            # Download the PDF
+            with self.session.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                
+                # Magic bytes are only needed when neither header nor URL says PDF
+                content_type = response.headers.get('content-type', '').lower()
+                check_magic = 'pdf' not in content_type and not url.lower().endswith('.pdf')
+                
+                # Stream to a temp file in the cache dir, then move it into place,
+                # so memory stays at one chunk and a crash never leaves a partial PDF
+                tmp = tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.part', delete=False)
+                hasher = hashlib.blake2b(digest_size=16)
+                size = 0
+                is_pdf = True
+                try:
+                    with tmp:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                            if check_magic:
+                                is_pdf = chunk.startswith(b'%PDF')
+                                if not is_pdf:
+                                    break
+                                check_magic = False
+                            tmp.write(chunk)
+                            hasher.update(chunk)
+                            size += len(chunk)
+                            if size > self.MAX_PDF_BYTES:
+                                is_pdf = False
+                                break
+                    if is_pdf:
+                        # Content-addressed: a mirror of a known PDF reuses its file
+                        content_hash = hasher.hexdigest()
+                        cache_path = self.cache_dir / content_hash[:2] / f"{content_hash}.pdf"
+                        if cache_path.exists():
+                            logger.debug(f"Same content as cached PDF: {cache_path}")
+                        else:
+                            cache_path.parent.mkdir(exist_ok=True)
+                            os.replace(tmp.name, cache_path)
+                finally:
+                    # Anything left behind is a rejected, duplicate or interrupted download
+                    if os.path.exists(tmp.name):
+                        os.unlink(tmp.name)
             
-            # Check if it's actually a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and not url.lower().endswith('.pdf'):
-                # Try to detect PDF magic bytes
-                content_start = response.content[:10]
-                if not content_start.startswith(b'%PDF'):
+            if not is_pdf:
+                if size > self.MAX_PDF_BYTES:
+                    logger.warning(f"Skipping oversized PDF (over {self.MAX_PDF_BYTES // 1048576} MB): {url[:50]}...")
+                else:
                     logger.warning(f"URL does not point to PDF: {url}")
-                    self.stats['skipped'] += 1
-                    return None
-            
-            # Save to cache
-            with open(cache_path, 'wb') as f:
-                f.write(response.content)
+                self._count('skipped')
+                return None
             
-            self.processed_urls.add(url)
-            self.stats['downloaded'] += 1
-            logger.info(f"Downloaded PDF: {url[:50]}... ({len(response.content) / 1024:.1f} KB)")
+            with self._lock:
+                self.processed_urls.add(url_hash)
+            self._index_download(url_hash, cache_path, size)
+            self._count('downloaded')
+            logger.info(f"Downloaded PDF: {url[:50]}... ({size / 1024:.1f} KB)")
             
             return cache_path
             
         except requests.exceptions.RequestException as e:
             logger.warning(f"Failed to download PDF from {url[:50]}...: {e}")
-            self.stats['failed'] += 1
+            self._count('failed')
             return None
         except Exception as e:
             logger.error(f"Unexpected error downloading PDF: {e}")
-            self.stats['failed'] += 1
+            self._count('failed')
             return None
     
+    def _head_looks_downloadable(self, url: str, timeout: int) -> bool:
+        """
+        Check a URL's headers before downloading it.
+        
+        Only clear rejections count: HTML/text responses and bodies over
+        MAX_PDF_BYTES. Generic types such as application/octet-stream still
+        go to the GET, where the magic bytes decide. Servers that refuse or
+        fail HEAD are given the benefit of the doubt.
+        """
+        try:
+            response = self.session.head(url, timeout=timeout, allow_redirects=True)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD failed for {url[:50]}..., trying GET: {e}")
+            return True
+        if not response.ok:
+            return True  # e.g. 405 Method Not Allowed
+        
+        content_type = response.headers.get('content-type', '').lower()
+        if 'pdf' not in content_type and content_type.startswith(('text/', 'application/xhtml')):
+            logger.warning(f"URL does not point to PDF: {url}")
+            return False
+        
+        content_length = response.headers.get('content-length', '')
+        if content_length.isdigit() and int(content_length) > self.MAX_PDF_BYTES:
+            logger.warning(f"Skipping oversized PDF ({int(content_length) / 1048576:.0f} MB): {url[:50]}...")
+            return False
+        return True
+    
+    def download_many(self, urls: list[str], max_workers: int = 8) -> dict[str, Path]:
+        """
+        Download several PDFs concurrently over the shared session.
+        
+        Args:
+            urls: PDF URLs (duplicates are fetched once)
+            max_workers: Parallel downloads
+            
+        Returns:
+            Dict of URL -> cached file path for the downloads that succeeded
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+        
+        paths = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+            futures = {executor.submit(self.download_pdf, url): url for url in unique_urls}
+            for future in as_completed(futures):
+                path = future.result()
+                if path:
+                    paths[futures[future]] = path
+        
+        logger.info(f"Downloaded {len(paths)}/{len(unique_urls)} PDFs")
+        return paths
+    
     def extract_content(self, pdf_path: Path, max_pages: int = 50) -> ExtractedContent:
         """
         Extract all content from a PDF file.
@@ -199,92 +475,155 @@ class PDFProcessor:
         Returns:
             ExtractedContent with text, tables, and images
         """
+        # Cached files are named by content hash; identical PDFs extract once
+        cache_key = (Path(pdf_path).stem, max_pages)
+        with self._lock:
+            cached = self.extraction_cache.get(cache_key)
+        if cached is None:
+            cached = self._load_extraction(Path(pdf_path), max_pages)
+        if cached is not None:
+            logger.debug(f"Using cached extraction for {pdf_path}")
+            with self._lock:
+                self.extraction_cache[cache_key] = cached
+            return cached
+        
         result = ExtractedContent()
         
         try:
-            # Extract text and images with PyMuPDF
-            doc = fitz.open(pdf_path)
-            result.page_count = min(len(doc), max_pages)
-            result.metadata = doc.metadata or {}
+            with fitz.open(pdf_path) as doc:
+                result.page_count = min(len(doc), max_pages)
+                result.metadata = doc.metadata or {}
             result.title = result.metadata.get('title', '')
             
+            # Extract text and images with PyMuPDF
             all_text = []
-            
-            for page_num in range(result.page_count):
-                page = doc[page_num]
-                
-                # Extract text
-                text = page.get_text()
+            for page_num, text, images, tables in self._extract_pages(pdf_path, result.page_count):
                 if text.strip():
                     all_text.append(f"--- Page {page_num + 1} ---\n{text}")
                 
-                # Extract images (limit to first 10 significant images)
-                if len(result.images) < 10:
-                    for img_index, img in enumerate(page.get_images(full=True)):
-                        try:
-                            xref = img[0]
-                            base_image = doc.extract_image(xref)
-                            image_bytes = base_image["image"]
-                            
-                            # Only keep images larger than 10KB (likely charts/graphs)
-                            if len(image_bytes) > 10240:
-                                result.images.append(image_bytes)
-                        except Exception:
-                            continue
-            
-            doc.close()
+                # Keep the first 10 significant images (in page order)
+                if len(result.images) < self.MAX_IMAGES:
+                    result.images.extend(images)
+                
+                # Tables come from the same page pass - no second parse of the PDF
+                for table_idx, table in enumerate(tables):
+                    if len(result.tables) >= self.MAX_TABLES:
+                        break
+                    result.tables.append(self._table_to_dict(table, page_num, table_idx))
             
             result.full_text = "\n\n".join(all_text)
             
-            # Extract tables with pdfplumber
-            result.tables = self._extract_tables(pdf_path, max_pages)
-            
             # Chunk the text for LLM processing
             result.text_chunks = self._chunk_text(result.full_text)
             
             result.extraction_success = True
-            self.stats['extracted'] += 1
+            self._count('extracted')
+            with self._lock:
+                self.extraction_cache[cache_key] = result
+            self._save_extraction(Path(pdf_path), max_pages, result)
             
             logger.info(f"Extracted: {result.page_count} pages, {len(result.tables)} tables, {len(result.images)} images")
             
         except Exception as e:
             result.error_message = str(e)
             logger.error(f"Failed to extract PDF content: {e}")
-            self.stats['failed'] += 1
+            self._count('failed')
         
         return result
     
-    def _extract_tables(self, pdf_path: Path, max_pages: int = 50) -> list[dict]:
-        """Extract tables from PDF using pdfplumber."""
-        tables = []
+    def _extraction_paths(self, pdf_path: Path, max_pages: int) -> tuple[Path, Path]:
+        """Sidecar JSON and image directory for a cached extraction."""
+        return pdf_path.with_name(f"{pdf_path.stem}.p{max_pages}.json"), pdf_path.parent / 'images'
+    
+    def _load_extraction(self, pdf_path: Path, max_pages: int) -> Optional[ExtractedContent]:
+        """Load an extraction saved by an earlier run, if it is newer than the PDF."""
+        sidecar, image_dir = self._extraction_paths(pdf_path, max_pages)
+        try:
+            if sidecar.stat().st_mtime < pdf_path.stat().st_mtime:
+                return None
+            data = fast_json.loads(sidecar.read_bytes())
+            images = [(image_dir / name).read_bytes() for name in data.pop('image_files')]
+            return ExtractedContent(images=images, **data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable extraction cache {sidecar.name}: {e}")
+            return None
+    
+    def _save_extraction(self, pdf_path: Path, max_pages: int, result: ExtractedContent):
+        """
+        Persist an extraction next to its PDF.
         
+        Images are written as separate blobs and referenced by name; the JSON
+        sidecar is swapped in last, so its presence means the entry is complete.
+        """
+        sidecar, image_dir = self._extraction_paths(pdf_path, max_pages)
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages[:max_pages]):
-                    page_tables = page.extract_tables()
-                    
-                    for table_idx, table in enumerate(page_tables):
-                        if table and len(table) > 1:  # Must have at least header + 1 row
-                            # Convert to dict format
-                            headers = table[0] if table[0] else [f"Col{i}" for i in range(len(table[1]))]
-                            
-                            table_data = {
-                                'page': page_num + 1,
-                                'table_index': table_idx + 1,
-                                'headers': headers,
-                                'rows': table[1:],
-                                'markdown': self._table_to_markdown(headers, table[1:])
-                            }
-                            tables.append(table_data)
-                            
-                            # Limit to 20 tables total
-                            if len(tables) >= 20:
-                                return tables
-                                
+            image_files = []
+            if result.images:
+                image_dir.mkdir(exist_ok=True)
+            for i, image in enumerate(result.images):
+                name = f"{pdf_path.stem}_p{max_pages}_{i}"
+                (image_dir / name).write_bytes(image)
+                image_files.append(name)
+            
+            data = {
+                'full_text': result.full_text,
+                'text_chunks': result.text_chunks,
+                'tables': result.tables,
+                'page_count': result.page_count,
+                'title': result.title,
+                'metadata': result.metadata,
+                'extraction_success': result.extraction_success,
+                'error_message': result.error_message,
+                'image_files': image_files,
+            }
+            tmp_path = sidecar.with_suffix('.tmp')
+            tmp_path.write_bytes(fast_json.dumps(data))
+            os.replace(tmp_path, sidecar)
         except Exception as e:
-            logger.warning(f"Table extraction failed: {e}")
+            logger.warning(f"Could not cache extraction for {pdf_path.name}: {e}")
+    
+    def _extract_pages(self, pdf_path: Path, page_count: int) -> list[tuple]:
+        """
+        Extract (page number, text, images, tables) for the first page_count pages.
+        
+        PyMuPDF documents must not be shared between threads, so long PDFs
+        are split into page ranges that worker processes open independently;
+        short ones are not worth the process start-up and run inline.
+        """
+        if page_count < self.PARALLEL_PAGE_THRESHOLD:
+            return _extract_page_range(str(pdf_path), 0, page_count, self.MAX_IMAGES, self.MAX_TABLES)
         
-        return tables
+        workers = min(os.cpu_count() or 1, -(-page_count // self.PAGES_PER_SHARD))
+        shard = -(-page_count // workers)
+        ranges = [(start, min(start + shard, page_count)) for start in range(0, page_count, shard)]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                shards = executor.map(
+                    _extract_page_range,
+                    [str(pdf_path)] * len(ranges),
+                    [start for start, _ in ranges],
+                    [stop for _, stop in ranges],
+                    [self.MAX_IMAGES] * len(ranges),
+                    [self.MAX_TABLES] * len(ranges),
+                )
+                return [page for pages in shards for page in pages]
+        except Exception as e:
+            logger.warning(f"Parallel page extraction failed, retrying inline: {e}")
+            return _extract_page_range(str(pdf_path), 0, page_count, self.MAX_IMAGES, self.MAX_TABLES)
+    
+    def _table_to_dict(self, table: list[list], page_num: int, table_idx: int) -> dict:
+        """Convert extracted table rows into the report's table dict format."""
+        headers = table[0] if table[0] else [f"Col{i}" for i in range(len(table[1]))]
+        return {
+            'page': page_num + 1,
+            'table_index': table_idx + 1,
+            'headers': headers,
+            'rows': table[1:],
+            'markdown': self._table_to_markdown(headers, table[1:])
+        }
     
     def _table_to_markdown(self, headers: list, rows: list) -> str:
         """Convert table to markdown format."""
@@ -294,18 +633,21 @@ class PDFProcessor:
         # Clean headers
         clean_headers = [str(h).strip() if h else f"Col{i}" for i, h in enumerate(headers)]
         
-        # Build markdown table
-        md = "| " + " | ".join(clean_headers) + " |\n"
-        md += "| " + " | ".join(["---"] * len(clean_headers)) + " |\n"
+        width = len(clean_headers)
+        
+        # Build markdown table as a list of lines, joined once
+        lines = [
+            "| " + " | ".join(clean_headers) + " |",
+            "| " + " | ".join(["---"] * width) + " |",
+        ]
         
         for row in rows[:20]:  # Limit rows
-            clean_row = [str(cell).strip() if cell else "" for cell in row]
+            clean_row = [str(cell).strip() if cell else "" for cell in row[:width]]
             # Pad row if needed
-            while len(clean_row) < len(clean_headers):
-                clean_row.append("")
-            md += "| " + " | ".join(clean_row[:len(clean_headers)]) + " |\n"
+            clean_row += [""] * (width - len(clean_row))
+            lines.append("| " + " | ".join(clean_row) + " |")
         
-        return md
+        return "\n".join(lines) + "\n"
     
     def _chunk_text(self, text: str, chunk_size: int = 8000, overlap: int = 500) -> list[str]:
         """
@@ -322,6 +664,16 @@ class PDFProcessor:
         if len(text) <= chunk_size:
             return [text] if text.strip() else []
         
+        # Find every boundary once, then binary-search each chunk's window
+        # instead of rescanning it with rfind
+        para_breaks = [m.start() for m in _PARAGRAPH_BREAK.finditer(text)]
+        sentence_breaks = [m.start() for m in _SENTENCE_BREAK.finditer(text)]
+        
+        def last_break(breaks: list[int], lo: int, hi: int) -> int:
+            """Last break position in [lo, hi], or -1."""
+            idx = bisect_right(breaks, hi) - 1
+            return breaks[idx] if idx >= 0 and breaks[idx] >= lo else -1
+        
         chunks = []
         start = 0
         
@@ -330,13 +682,14 @@ class PDFProcessor:
             
             # Try to break at paragraph or sentence boundary
             if end < len(text):
-                # Look for paragraph break
-                para_break = text.rfind('\n\n', start + chunk_size // 2, end)
+                lo = start + chunk_size // 2
+                # Look for paragraph break (the whole '\n\n' must fit before end)
+                para_break = last_break(para_breaks, lo, end - 2)
                 if para_break > start:
                     end = para_break
                 else:
                     # Look for sentence break
-                    sentence_break = text.rfind('. ', start + chunk_size // 2, end)
+                    sentence_break = last_break(sentence_breaks, lo, end - 2)
                     if sentence_break > start:
                         end = sentence_break + 1
             
@@ -351,7 +704,7 @@ class PDFProcessor:
     def cleanup(self):
         """Remove all cached PDFs to free space."""
         count = 0
-        for pdf_file in self.cache_dir.glob("*.pdf"):
+        for pdf_file in self.cache_dir.rglob("*.pdf"):
             try:
                 pdf_file.unlink()
                 count += 1
@@ -360,12 +713,41 @@ class PDFProcessor:
         
         logger.info(f"Cleaned up {count} cached PDFs")
         
+        # Extraction sidecars and images go with their PDFs
+        for pattern in ("*/*.json", "*/images/*"):
+            for extra_file in self.cache_dir.glob(pattern):
+                try:
+                    extra_file.unlink()
+                except Exception as e:
+                    logger.warning(f"Failed to delete {extra_file}: {e}")
+        
+        # Drop the now-empty content-hash shard directories
+        for directory in sorted(self.cache_dir.glob("*/**/"), reverse=True):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+        
         # Reset tracking
         self.processed_urls.clear()
+        self.extraction_cache.clear()
+        if self._index is not None:
+            try:
+                with self._lock:
+                    self._index.execute('DELETE FROM urls')
+                    self._index.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not clear PDF index: {e}")
+    
+    def _count(self, stat: str):
+        """Increment a statistics counter (thread-safe)."""
+        with self._lock:
+            self.stats[stat] += 1
     
     def get_stats(self) -> dict:
         """Get processing statistics."""
-        return self.stats.copy()
+        with self._lock:
+            return self.stats.copy()
 
 
 def extract_key_statistics(text: str) -> list[str]:
@@ -379,39 +761,17 @@ def extract_key_statistics(text: str) -> list[str]:
         List of extracted statistics
     """
     stats = []
+    seen = set()
     
-    # Patterns for common statistics
-    patterns = [
-        # Percentages
-        r'(\d+(?:\.\d+)?)\s*(?:percent|%)',
-        # Dollar amounts
-        r'\$\s*(\d+(?:\.\d+)?)\s*(?:billion|million|trillion|B|M|T)',
-        # Growth rates
-        r'(?:grew|growth|increase|decline|fell|rose)\s+(?:by\s+)?(\d+(?:\.\d+)?)\s*%',
-        # Year-over-year
-        r'(\d+(?:\.\d+)?)\s*%\s*(?:YoY|year-over-year|y/y)',
-        # Basis points
-        r'(\d+)\s*(?:basis points|bps)',
-        # GDP figures
-        r'GDP.{1,30}?(\d+(?:\.\d+)?)\s*%',
-        # Unemployment
-        r'unemployment.{1,20}?(\d+(?:\.\d+)?)\s*%',
-        # Inflation
-        r'inflation.{1,20}?(\d+(?:\.\d+)?)\s*%',
-    ]
-    
-    text_lower = text.lower()
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
+    for pattern in _STAT_PATTERNS:
         # Get context around each match
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        for match in pattern.finditer(text):
             start = max(0, match.start() - 50)
             end = min(len(text), match.end() + 50)
-            context = text[start:end].strip()
             # Clean up and add if not duplicate
-            context = re.sub(r'\s+', ' ', context)
-            if context and context not in stats:
+            context = _WHITESPACE.sub(' ', text[start:end].strip())
+            if context and context not in seen:
+                seen.add(context)
                 stats.append(context)
                 if len(stats) >= 15:  # Limit to 15 stats
                     return stats
@@ -0,0 +1,93 @@
+"""
+Rate Limiter - Thread-safe token bucket shared by the AI analyzers.
+Allows short bursts up to the bucket capacity while holding the long-run
+request rate to the provider's free-tier allowance.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Classic token bucket.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``refill_rate`` tokens per second. Each API call consumes one token;
+    when the bucket is empty the caller sleeps just long enough for the
+    next token to arrive.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, name: str = "api"):
+        """
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+            name: Label used in log messages
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.name = name
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill."""
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.last_refill = now
+
+    def consume(self, n: float = 1) -> float:
+        """
+        Take ``n`` tokens, blocking until they are available.
+
+        The lock is held while waiting so concurrent callers are served in
+        turn and the rate stays global across threads.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait_time = 0.0
+            if self.tokens < n:
+                wait_time = (n - self.tokens) / self.refill_rate
+                if wait_time > 1:
+                    logger.info(f"[{self.name}] Rate limit reached, waiting {wait_time:.1f}s")
+                time.sleep(wait_time)
+                self._refill(time.monotonic())
+            self.tokens -= n
+            return wait_time
+
+    def try_consume(self, n: float = 1) -> bool:
+        """Take ``n`` tokens if available right now; never blocks."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens < n:
+                return False
+            self.tokens -= n
+            return True
+
+    def get_state(self) -> dict:
+        """Snapshot the bucket so it can be persisted across runs."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {'tokens': self.tokens, 'saved_at': time.time()}
+
+    def set_state(self, state: dict):
+        """
+        Restore a snapshot from get_state.
+
+        The monotonic clock does not survive restarts, so the tokens that
+        accrued while the process was down are credited from wall-clock time.
+        """
+        with self._lock:
+            downtime = max(0.0, time.time() - state.get('saved_at', 0))
+            tokens = state.get('tokens', self.capacity) + downtime * self.refill_rate
+            self.tokens = min(self.capacity, tokens)
+            self.last_refill = time.monotonic()
@@ -0,0 +1,26 @@
+"""
+Themes - Thematic tag keywords shared by the Gemini and NVIDIA analyzers.
+Both tag articles with the same theme set, so the keyword table lives here
+rather than being copied (and drifting) per analyzer.
+"""
+
+# Thematic tags - an article gets every theme that matches
+# (keywords are lowercase; each analyzer compiles its own matcher)
+THEME_KEYWORDS = {
+    'Monetary Policy': ('interest rate', 'central bank', 'monetary policy', 'repo rate',
+                        'fed', 'federal reserve', 'ecb', 'fomc', 'mpc', 'quantitative'),
+    'Inflation': ('inflation', 'inflationary', 'cpi', 'price index', 'deflation', 'stagflation'),
+    'Growth & GDP': ('gdp', 'growth', 'recession', 'expansion', 'economic outlook'),
+    'Employment': ('employment', 'unemployment', 'jobs', 'labor', 'wage', 'workforce'),
+    'Trade': ('trade', 'trading', 'trader', 'tariff', 'export', 'import', 'wto', 'trade war',
+              'protectionism'),
+    'Fiscal Policy': ('budget', 'fiscal', 'government spending', 'taxation', 'deficit'),
+    'Financial Stability': ('financial stability', 'systemic risk', 'banking crisis', 'stress test'),
+    'Currency & Forex': ('currency', 'currencies', 'forex', 'exchange rate', 'dollar', 'yuan',
+                         'rupee'),
+    'Debt & Credit': ('debt', 'credit', 'bond', 'yield', 'sovereign debt', 'credit rating'),
+    'Technology & AI': ('technology', 'technologies', 'digital', 'ai', 'fintech',
+                        'cryptocurrency'),
+    'Climate & ESG': ('climate', 'esg', 'sustainable', 'green', 'carbon', 'net zero'),
+    'Emerging Markets': ('emerging market', 'developing', 'brics', 'frontier market'),
+}
@@ -4,6 +4,6 @@ from .base_collector import BaseCollector, Article
 from .rss_collector import RSSCollector
 from .web_collector import WebCollector
 from .collector_manager import CollectorManager
-from .pdf_extractor import extract_pdf_text, detect_pdf_links, summarize_pdf_content
+from .pdf_extractor import extract_pdf_text, extract_pdf_texts, detect_pdf_links, summarize_pdf_content
 
-__all__ = ['BaseCollector', 'Article', 'RSSCollector', 'WebCollector', 'CollectorManager', 'extract_pdf_text', 'detect_pdf_links', 'summarize_pdf_content']
+__all__ = ['BaseCollector', 'Article', 'RSSCollector', 'WebCollector', 'CollectorManager', 'extract_pdf_text', 'extract_pdf_texts', 'detect_pdf_links', 'summarize_pdf_content']
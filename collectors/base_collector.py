@@ -4,15 +4,53 @@ All collectors inherit from BaseCollector.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import urlsplit
 import logging
+import threading
+import time
+
+from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# One semaphore per host, shared by every collector thread, so raising the
+# number of organizations collected in parallel never floods a single site
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_next_start: dict[str, float] = {}  # Earliest monotonic start of the next request
+_host_slots_lock = threading.Lock()
+
+
+@contextmanager
+def host_slot(url: str, interval: Optional[float] = None):
+    """
+    Hold one of the Settings.MAX_REQUESTS_PER_HOST request slots for url's host.
+    
+    Request starts to the same host are also spaced at least ``interval``
+    seconds apart (default Settings.HOST_REQUEST_INTERVAL), replacing fixed
+    sleeps between sequential requests.
+    """
+    if interval is None:
+        interval = Settings.HOST_REQUEST_INTERVAL
+    host = urlsplit(url).netloc.lower()
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(Settings.MAX_REQUESTS_PER_HOST)
+    with slot:
+        with _host_slots_lock:
+            now = time.monotonic()
+            start = max(now, _host_next_start.get(host, now))
+            _host_next_start[host] = start + interval
+        if start > now:
+            time.sleep(start - now)
+        yield
 
-@dataclass
+
+@dataclass(slots=True)
 class Article:
     """Represents a single article/report/news item from any source."""
     
@@ -44,6 +82,14 @@ class Article:
     # Deep PDF analysis results
     deep_analysis: dict = field(default_factory=dict)  # Charts, tables, statistics from PDF
     
+    # Lowercased text cached by the analyzers for keyword matching
+    _title_lower: str = field(default='', init=False, repr=False, compare=False)
+    _summary_lower: str = field(default='', init=False, repr=False, compare=False)
+    _combined_lower: str = field(default='', init=False, repr=False, compare=False)
+    
+    # Newest-first sort key: POSIX timestamp, -inf when undated so those sort last
+    _sort_ts: float = field(default=float('-inf'), init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate and normalize data."""
         # Ensure title and URL are not empty
@@ -55,6 +101,9 @@ class Article:
         # Normalize source names
         self.source = self.source.strip()
         self.source_full = self.source_full.strip()
+        
+        if self.published_date:
+            self._sort_ts = self.published_date.timestamp()
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -124,6 +173,13 @@ class BaseCollector(ABC):
             return True  # Include items without dates
         return date >= self.cutoff_date
     
+    def unique_recent(self, articles: list[Article]) -> list[Article]:
+        """Drop duplicate URLs (first occurrence wins) and articles older than the lookback."""
+        unique_articles = {}
+        for article in articles:
+            unique_articles.setdefault(article.url, article)
+        return [a for a in unique_articles.values() if self.is_within_lookback(a.published_date)]
+    
     def create_article(
         self,
         title: str,
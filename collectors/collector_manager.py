@@ -2,9 +2,14 @@
 Collector Manager - Orchestrates all collectors and aggregates results.
 """
 
+import heapq
 import logging
+from collections import defaultdict
+from itertools import chain
+from operator import attrgetter
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import os
 import time
 
 from .base_collector import Article
@@ -14,6 +19,59 @@ from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Newest-first sort key (Article precomputes the timestamp once)
+_date_key = attrgetter('_sort_ts')
+
+
+def _collect_from_org(org_config: dict, lookback_days: int) -> list[Article]:
+    """
+    Collect articles from a single organization using appropriate collectors.
+    
+    Module-level so it can also run in a worker process.
+    
+    Args:
+        org_config: Organization configuration dictionary
+        lookback_days: Number of days to look back
+    
+    Returns:
+        List of articles from this organization
+    """
+    short_name = org_config.get('short_name', 'Unknown')
+    articles = []
+    
+    # Use RSS collector if feeds are available
+    if org_config.get('feeds'):
+        try:
+            rss_collector = RSSCollector(org_config, lookback_days)
+            rss_articles = rss_collector.collect()
+            articles.extend(rss_articles)
+        except Exception as e:
+            logger.error(f"[{short_name}] RSS collection error: {e}")
+    
+    # Use web collector if scrape URLs are available
+    if org_config.get('scrape_urls'):
+        try:
+            web_collector = WebCollector(org_config, lookback_days)
+            web_articles = web_collector.collect()
+            articles.extend(web_articles)
+        except Exception as e:
+            logger.error(f"[{short_name}] Web scraping error: {e}")
+    
+    # Deduplicate by URL (first occurrence wins)
+    unique_articles = {}
+    for article in articles:
+        unique_articles.setdefault(article.url, article)
+    
+    # Keep the newest max articles; a bounded heap avoids sorting them all
+    max_articles = Settings.MAX_ARTICLES_PER_ORG
+    if len(unique_articles) > max_articles:
+        logger.debug(f"[{short_name}] Limiting from {len(unique_articles)} to {max_articles} articles")
+    return heapq.nlargest(
+        max_articles,
+        unique_articles.values(),
+        key=_date_key
+    )
+
 
 class CollectorManager:
     """
@@ -31,13 +89,18 @@ class CollectorManager:
         self.lookback_days = lookback_days or Settings.LOOKBACK_DAYS
         self.organizations = Settings.load_organizations()
         
-    def collect_all(self, max_workers: int = 5, specific_orgs: list[str] = None) -> dict[str, list[Article]]:
+    def collect_all(self, max_workers: int = None, specific_orgs: list[str] = None,
+                    use_processes: bool = False) -> dict[str, list[Article]]:
         """
         Collect articles from all organizations.
         
         Args:
-            max_workers: Number of parallel workers
+            max_workers: Number of parallel workers (default Settings.MAX_COLLECTOR_WORKERS);
+                requests to any one host are further capped by Settings.MAX_REQUESTS_PER_HOST
             specific_orgs: Optional list of specific organization short names to collect from
+            use_processes: Collect in worker processes (default one per CPU) so
+                HTML parsing is not serialized by the GIL; the per-host request
+                limit then applies per process
         
         Returns:
             Dictionary mapping organization short_name to list of articles
@@ -56,9 +119,16 @@ class CollectorManager:
         logger.info(f"Starting collection for {len(orgs_to_process)} organizations")
         
         # Process organizations with controlled parallelism
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if use_processes:
+            executor_class = ProcessPoolExecutor
+            max_workers = max_workers or min(os.cpu_count() or 1, max(len(orgs_to_process), 1))
+        else:
+            executor_class = ThreadPoolExecutor
+            max_workers = max_workers or Settings.MAX_COLLECTOR_WORKERS
+        
+        with executor_class(max_workers=max_workers) as executor:
             future_to_org = {
-                executor.submit(self._collect_from_org, org): org 
+                executor.submit(_collect_from_org, org, self.lookback_days): org 
                 for org in orgs_to_process
             }
             
@@ -80,59 +150,6 @@ class CollectorManager:
         
         return results
     
-    def _collect_from_org(self, org_config: dict) -> list[Article]:
-        """
-        Collect articles from a single organization using appropriate collectors.
-        
-        Args:
-            org_config: Organization configuration dictionary
-        
-        Returns:
-            List of articles from this organization
-        """
-        short_name = org_config.get('short_name', 'Unknown')
-        articles = []
-        
-        # Use RSS collector if feeds are available
-        if org_config.get('feeds'):
-            try:
-                rss_collector = RSSCollector(org_config, self.lookback_days)
-                rss_articles = rss_collector.collect()
-                articles.extend(rss_articles)
-            except Exception as e:
-                logger.error(f"[{short_name}] RSS collection error: {e}")
-        
-        # Use web collector if scrape URLs are available
-        if org_config.get('scrape_urls'):
-            try:
-                web_collector = WebCollector(org_config, self.lookback_days)
-                web_articles = web_collector.collect()
-                articles.extend(web_articles)
-            except Exception as e:
-                logger.error(f"[{short_name}] Web scraping error: {e}")
-        
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_articles = []
-        for article in articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
-                unique_articles.append(article)
-        
-        # Sort by date (newest first)
-        unique_articles.sort(
-            key=lambda a: a.published_date or datetime.min,
-            reverse=True
-        )
-        
-        # Limit to max articles per org
-        max_articles = Settings.MAX_ARTICLES_PER_ORG
-        if len(unique_articles) > max_articles:
-            logger.debug(f"[{short_name}] Limiting from {len(unique_articles)} to {max_articles} articles")
-            unique_articles = unique_articles[:max_articles]
-        
-        return unique_articles
-    
     def collect_single(self, org_short_name: str) -> list[Article]:
         """
         Collect articles from a single organization.
@@ -165,7 +182,7 @@ class CollectorManager:
         
         # Sort by date (newest first)
         all_articles.sort(
-            key=lambda a: a.published_date or datetime.min,
+            key=_date_key,
             reverse=True
         )
         
@@ -184,23 +201,13 @@ class CollectorManager:
         if results is None:
             results = self.collect_all()
         
-        by_category = {}
-        for articles in results.values():
-            for article in articles:
-                category = article.category
-                if category not in by_category:
-                    by_category[category] = []
-                by_category[category].append(article)
+        by_category = defaultdict(list)
+        for article in chain.from_iterable(results.values()):
+            by_category[article.category].append(article)
         
         # Sort each category by date
-        for category in by_category:
-            by_category[category].sort(
-                key=lambda a: a.published_date or datetime.min,
-                reverse=True
-            )
+        for category_articles in by_category.values():
+            category_articles.sort(key=_date_key, reverse=True)
         
-        return by_category
-
+        return dict(by_category)
 
-# Import datetime for sorting
-from datetime import datetime
@@ -0,0 +1,142 @@
+"""
+Fast Feed - lxml-based parser for well-formed RSS 2.0, RSS 1.0 and Atom feeds.
+Returns entries shaped like feedparser's, so callers can use it first and fall
+back to feedparser for anything it cannot handle.
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Optional
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Root elements (local names) of the feed formats handled here
+FEED_ROOTS = frozenset({'rss', 'feed', 'RDF'})
+ENTRY_TAGS = frozenset({'item', 'entry'})
+
+# Entry child (local name) -> feedparser key for plain-text fields
+TEXT_FIELDS = {
+    'title': 'title',
+    'guid': 'id',
+    'id': 'id',
+    'pubDate': 'published',
+    'published': 'published',
+    'issued': 'published',
+    'updated': 'updated',
+    'modified': 'updated',
+    'date': 'updated',  # dc:date
+    'description': 'summary',
+    'summary': 'summary',
+    'creator': 'author',  # dc:creator
+}
+
+
+class FeedEntry(dict):
+    """Dict with attribute access, like the feedparser entries RSSCollector reads."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _parse_date(value: str) -> Optional[time.struct_time]:
+    """RFC 822 (RSS) or ISO 8601 (Atom) date -> UTC struct_time, as feedparser gives."""
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.utctimetuple()
+
+
+def _inner_text(element) -> str:
+    """Element text, or its serialized children for inline (xhtml) content."""
+    if len(element):
+        return (element.text or '') + ''.join(
+            etree.tostring(child, encoding='unicode') for child in element
+        )
+    return element.text or ''
+
+
+def _entry_from_element(element) -> FeedEntry:
+    entry = FeedEntry()
+    have_alternate = False
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue  # Comments and processing instructions
+        name = etree.QName(child).localname
+
+        if name == 'link':
+            # RSS: text; Atom: href attribute, preferring rel="alternate" (the default)
+            href = child.get('href') or (child.text or '').strip()
+            is_alternate = child.get('rel', 'alternate') == 'alternate'
+            if href and not have_alternate and ('link' not in entry or is_alternate):
+                entry['link'] = href
+                have_alternate = is_alternate
+        elif name in ('encoded', 'content'):
+            entry.setdefault('content', []).append({'value': _inner_text(child)})
+        elif name == 'author':
+            # RSS: text; Atom: <author><name>...</name></author>
+            author_name = next((c.text for c in child if isinstance(c.tag, str)
+                                and etree.QName(c).localname == 'name'), None)
+            entry.setdefault('author', (author_name or child.text or '').strip())
+        elif name == 'category':
+            term = child.get('term') or (child.text or '').strip()
+            if term:
+                entry.setdefault('tags', []).append({'term': term})
+        elif name in TEXT_FIELDS:
+            key = TEXT_FIELDS[name]
+            entry.setdefault(key, _inner_text(child) if key == 'summary' else (child.text or ''))
+
+    for key in ('published', 'updated'):
+        if entry.get(key):
+            parsed = _parse_date(entry[key])
+            if parsed:
+                entry[f'{key}_parsed'] = parsed
+    return entry
+
+
+def parse_feed(content: bytes) -> Optional[list[FeedEntry]]:
+    """
+    Parse feed XML into feedparser-style entries.
+
+    Args:
+        content: Raw feed document
+
+    Returns:
+        List of entries, or None if the document is not a well-formed RSS/Atom
+        feed (the caller should then fall back to feedparser)
+    """
+    entries = []
+    try:
+        context = etree.iterparse(BytesIO(content), events=('start', 'end'),
+                                  resolve_entities=False, no_network=True)
+        root_checked = False
+        for event, element in context:
+            if not isinstance(element.tag, str):
+                continue
+            if event == 'start':
+                if not root_checked:
+                    if etree.QName(element).localname not in FEED_ROOTS:
+                        return None
+                    root_checked = True
+                continue
+            if etree.QName(element).localname in ENTRY_TAGS:
+                entries.append(_entry_from_element(element))
+                element.clear(keep_tail=False)  # Keep memory flat on long feeds
+    except etree.XMLSyntaxError as e:
+        logger.debug(f"Feed is not well-formed XML, falling back: {e}")
+        return None
+    return entries
@@ -0,0 +1,39 @@
+"""
+HTTP Client - One pooled requests session shared by all collectors.
+RSS feeds, scraped pages and PDF downloads often hit the same hosts, so
+sharing the connection pool lets every fetch reuse warm keep-alive connections.
+"""
+
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import Settings
+
+# Connections kept per host pool; collector threads beyond this wait for a slot
+POOL_SIZE = 32
+
+_session: requests.Session = None
+_session_pid: int = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide collector session, creating it on first use.
+
+    A worker process (CollectorManager's use_processes mode) gets its own
+    session rather than reusing sockets inherited from the parent.
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            session.headers.update({'User-Agent': Settings.USER_AGENT})
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session, _session_pid = session, os.getpid()
+        return _session
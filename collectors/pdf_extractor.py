@@ -3,38 +3,124 @@ PDF Extractor utility for extracting text from PDF reports.
 Uses PyMuPDF (fitz) for PDF parsing.
 """
 
+import hashlib
+import json
 import logging
-from pathlib import Path
+import os
+import re
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urljoin
 import requests
+from bs4 import BeautifulSoup
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+from config.settings import Settings
+from .http_client import get_session
 
 logger = logging.getLogger(__name__)
 
+# Extracted text is cached by PDF content hash; a per-URL entry remembers the
+# ETag/Last-Modified so unchanged reports are revalidated with a 304
+PDF_TEXT_CACHE_DIR = Settings.CACHE_DIR / 'pdf_text'
+
+# PyMuPDF is not thread-safe, even across separate documents: batch downloads
+# run in parallel, but parsing is serialized (the cache makes repeats free)
+_FITZ_LOCK = threading.Lock()
+
+# A line worth keeping in a summary, captured without surrounding whitespace:
+# not a page marker, at least 10 characters, and not just a number
+_KEEP_LINE_RE = re.compile(
+    r'^[^\S\n]*'
+    r'(?!--- Page)'
+    r'(?![\d.,]*\d[\d.,]*[^\S\n]*$)'
+    r'(\S.{8,}\S)'
+    r'[^\S\n]*$',
+    re.MULTILINE
+)
+
+
+def _write_atomic(path: Path, data: str):
+    """Write a cache file via temp file + rename so readers never see a partial one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp name: batch threads may write the same entry at once
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                     suffix='.tmp', delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+
+def _url_entry_path(url: str) -> Path:
+    return PDF_TEXT_CACHE_DIR / 'urls' / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+
+def _text_path(digest: str, max_pages: int) -> Path:
+    return PDF_TEXT_CACHE_DIR / digest[:2] / f"{digest}.p{max_pages}.txt"
+
+
+def _load_url_entry(url: str) -> Optional[dict]:
+    try:
+        return json.loads(_url_entry_path(url).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def _load_cached_text(digest: str, max_pages: int) -> Optional[str]:
+    try:
+        return _text_path(digest, max_pages).read_text(encoding='utf-8')
+    except OSError:
+        return None
+
 
-def extract_pdf_text(url: str, max_pages: int = 10) -> Optional[str]:
+def extract_pdf_text(url: str, max_pages: int = 10,
+                     session: Optional[requests.Session] = None) -> Optional[str]:
     """
     Download and extract text from a PDF URL.
     
     Args:
         url: URL to the PDF file
         max_pages: Maximum number of pages to extract
+        session: Session to download with, e.g. a collector's already warmed-up
+            one (defaults to the collectors' shared session)
     
     Returns:
         Extracted text or None if extraction failed
     """
-    try:
-        import fitz  # PyMuPDF
-    except ImportError:
+    if fitz is None:
         logger.warning("PyMuPDF not installed. Run: pip install pymupdf")
         return None
     
+    session = session or get_session()
+    
     try:
+        # Revalidate a previously seen URL instead of downloading it again
+        url_entry = _load_url_entry(url)
+        headers = {}
+        if url_entry:
+            if url_entry.get('etag'):
+                headers['If-None-Match'] = url_entry['etag']
+            if url_entry.get('last_modified'):
+                headers['If-Modified-Since'] = url_entry['last_modified']
+        
         # Download PDF
         logger.info(f"Downloading PDF: {url[:50]}...")
-        response = requests.get(url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        response = session.get(url, timeout=30, headers=headers)
+        
+        if response.status_code == 304:
+            cached = _load_cached_text(url_entry['sha256'], max_pages)
+            if cached is not None:
+                logger.debug(f"PDF unchanged, using cached text: {url[:50]}...")
+                return cached
+            # Text for this page limit was never cached - fetch the body after all
+            response = session.get(url, timeout=30)
         
         if response.status_code != 200:
             logger.warning(f"Failed to download PDF: {response.status_code}")
@@ -46,14 +132,22 @@ def extract_pdf_text(url: str, max_pages: int = 10) -> Optional[str]:
             logger.warning(f"URL does not appear to be a PDF: {content_type}")
             return None
         
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-            tmp.write(response.content)
-            tmp_path = tmp.name
+        # Identical bytes (mirrors, re-posted reports) share one cached extraction
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()
+        _write_atomic(_url_entry_path(url), json.dumps({
+            'sha256': digest,
+            'etag': response.headers.get('ETag', ''),
+            'last_modified': response.headers.get('Last-Modified', ''),
+        }))
+        cached = _load_cached_text(digest, max_pages)
+        if cached is not None:
+            logger.debug(f"Using cached text for PDF content {digest[:12]}")
+            return cached
         
-        # Extract text
+        # Extract text straight from the downloaded bytes - no temp file
         text_parts = []
-        with fitz.open(tmp_path) as doc:
+        with _FITZ_LOCK, fitz.open(stream=data, filetype='pdf') as doc:
             total_pages = min(len(doc), max_pages)
             
             for page_num in range(total_pages):
@@ -62,12 +156,15 @@ def extract_pdf_text(url: str, max_pages: int = 10) -> Optional[str]:
                 if text.strip():
                     text_parts.append(f"--- Page {page_num + 1} ---\n{text}")
         
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
-        
         if text_parts:
             extracted = "\n\n".join(text_parts)
             logger.info(f"Extracted {len(text_parts)} pages, {len(extracted)} characters")
+            text_path = _text_path(digest, max_pages)
+            _write_atomic(text_path, extracted)
+            _write_atomic(text_path.with_name(f"{digest}.meta.json"), json.dumps({
+                'url': url,
+                'extracted_at': time.time(),
+            }))
             return extracted
         
         logger.warning("No text extracted from PDF")
@@ -78,6 +175,29 @@ def extract_pdf_text(url: str, max_pages: int = 10) -> Optional[str]:
         return None
 
 
+def extract_pdf_texts(urls: list[str], max_pages: int = 10, max_workers: int = 8,
+                      session: Optional[requests.Session] = None) -> dict[str, Optional[str]]:
+    """
+    Download and extract text from several PDF URLs concurrently.
+    
+    Args:
+        urls: URLs to PDF files (duplicates are fetched once)
+        max_pages: Maximum number of pages to extract per PDF
+        max_workers: Parallel downloads
+        session: Session to download with (defaults to the collectors' shared session)
+    
+    Returns:
+        Dictionary mapping each URL to its extracted text (None if extraction failed)
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        texts = executor.map(lambda url: extract_pdf_text(url, max_pages, session), unique_urls)
+        return dict(zip(unique_urls, texts))
+
+
 def detect_pdf_links(html_content: str, base_url: str) -> list[str]:
     """
     Detect PDF links in HTML content.
@@ -89,9 +209,6 @@ def detect_pdf_links(html_content: str, base_url: str) -> list[str]:
     Returns:
         List of PDF URLs found
     """
-    from bs4 import BeautifulSoup
-    from urllib.parse import urljoin
-    
     pdf_links = []
     try:
         soup = BeautifulSoup(html_content, 'lxml')
@@ -123,28 +240,9 @@ def summarize_pdf_content(text: str, max_length: int = 2000) -> str:
     Returns:
         Cleaned and truncated text
     """
-    # Remove common PDF artifacts
-    lines = text.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Skip page markers
-        if line.startswith('--- Page'):
-            continue
-        
-        # Skip very short lines (likely headers/footers)
-        if len(line) < 10:
-            continue
-        
-        # Skip lines that are just numbers
-        if line.replace('.', '').replace(',', '').isdigit():
-            continue
-        
-        cleaned_lines.append(line)
-    
-    cleaned_text = '\n'.join(cleaned_lines)
+    # Remove common PDF artifacts (page markers, short header/footer lines,
+    # bare numbers) in one regex pass instead of a per-line Python loop
+    cleaned_text = '\n'.join(_KEEP_LINE_RE.findall(text))
     
     # Truncate to max length at a sentence boundary if possible
     if len(cleaned_text) > max_length:
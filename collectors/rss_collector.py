@@ -4,17 +4,47 @@ Many organizations provide RSS feeds for their news and publications.
 """
 
 import feedparser
+import html
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 from dateutil import parser as date_parser
-import time
 
-from .base_collector import BaseCollector, Article
+from .base_collector import BaseCollector, Article, host_slot
+from .fast_feed import parse_feed
+from .http_client import get_session
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Feed summaries are short snippets; stripping tags with regexes is far
+# cheaper than building a parse tree for each one
+_HIDDEN_HTML_RE = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+# Only tag-shaped markup (<p ...>, </p>, <!DOCTYPE ...>); a bare '<' in text such
+# as "inflation <2% vs target > 3" is kept
+_TAG_RE = re.compile(r'</?[A-Za-z][^>]*>|<![^>]*>')
+
+# Title keywords per content type, in priority order. Each alternative is a
+# lookahead anchored at the start, so the first type with a keyword anywhere
+# in the title wins (not the leftmost keyword); m.lastgroup names the type.
+_CONTENT_TYPE_KEYWORDS = (
+    ('report', ('report', 'outlook', 'survey')),
+    ('press_release', ('press release', 'announcement')),
+    ('working_paper', ('working paper', 'research paper', 'paper')),
+    ('speech', ('speech', 'remarks', 'address')),
+    ('insight', ('blog', 'insight', 'analysis')),
+    ('data_release', ('data', 'statistics')),
+)
+_CONTENT_TYPE_RE = re.compile(
+    '^(?:' + '|'.join(
+        f"(?=.*?(?P<{content_type}>{'|'.join(map(re.escape, keywords))}))"
+        for content_type, keywords in _CONTENT_TYPE_KEYWORDS
+    ) + ')',
+    re.IGNORECASE | re.DOTALL
+)
+
 
 class RSSCollector(BaseCollector):
     """
@@ -22,46 +52,54 @@ class RSSCollector(BaseCollector):
     Used for organizations that provide RSS feeds.
     """
     
+    def __init__(self, org_config: dict, lookback_days: int = 7):
+        super().__init__(org_config, lookback_days)
+        self.session = get_session()
+    
     def collect(self) -> list[Article]:
         """Collect articles from all RSS feeds for this organization."""
         articles = []
         
-        for feed_url in self.feeds:
-            try:
-                feed_articles = self._parse_feed(feed_url)
-                articles.extend(feed_articles)
-            except Exception as e:
-                logger.error(f"[{self.short_name}] Error parsing feed {feed_url}: {e}")
-            
-            # Be polite - small delay between requests
-            time.sleep(0.5)
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
-                unique_articles.append(article)
-        
-        # Filter by date
-        filtered = [a for a in unique_articles if self.is_within_lookback(a.published_date)]
+        # Feeds are fetched concurrently; host_slot keeps requests to any one
+        # host polite, so no fixed sleep between feeds is needed
+        if self.feeds:
+            with ThreadPoolExecutor(max_workers=min(8, len(self.feeds))) as executor:
+                for feed_articles in executor.map(self._parse_feed_safe, self.feeds):
+                    articles.extend(feed_articles)
+        
+        # Remove duplicates based on URL, then filter by date
+        filtered = self.unique_recent(articles)
         
         self.log_collection_result(filtered)
         return filtered
     
+    def _parse_feed_safe(self, feed_url: str) -> list[Article]:
+        """Parse a feed, logging and swallowing errors so one bad feed can't sink the rest."""
+        try:
+            return self._parse_feed(feed_url)
+        except Exception as e:
+            logger.error(f"[{self.short_name}] Error parsing feed {feed_url}: {e}")
+            return []
+    
     def _parse_feed(self, feed_url: str) -> list[Article]:
         """Parse a single RSS/Atom feed."""
         logger.debug(f"[{self.short_name}] Parsing feed: {feed_url}")
         
-        # Parse the feed
-        feed = feedparser.parse(feed_url)
+        # Fetch the feed
+        with host_slot(feed_url):
+            response = self.session.get(feed_url, timeout=Settings.REQUEST_TIMEOUT)
+        response.raise_for_status()
         
-        if feed.bozo and feed.bozo_exception:
-            logger.warning(f"[{self.short_name}] Feed parsing warning: {feed.bozo_exception}")
+        # Well-formed feeds go through lxml; feedparser handles the rest
+        entries = parse_feed(response.content)
+        if entries is None:
+            feed = feedparser.parse(response.content)
+            if feed.bozo and feed.bozo_exception:
+                logger.warning(f"[{self.short_name}] Feed parsing warning: {feed.bozo_exception}")
+            entries = feed.entries
         
         articles = []
-        for entry in feed.entries:
+        for entry in entries:
             try:
                 article = self._entry_to_article(entry)
                 if article:
@@ -146,31 +184,15 @@ class RSSCollector(BaseCollector):
     
     def _clean_html(self, html_text: str) -> str:
         """Remove HTML tags and clean up text."""
-        from bs4 import BeautifulSoup
         if not html_text:
             return ''
-        soup = BeautifulSoup(html_text, 'html.parser')
-        text = soup.get_text(separator=' ')
+        text = _TAG_RE.sub(' ', _HIDDEN_HTML_RE.sub(' ', html_text))
+        text = html.unescape(text)
         # Clean up whitespace
         text = ' '.join(text.split())
         return text
     
     def _determine_content_type(self, title: str, tags: list[str]) -> str:
         """Determine the type of content based on title and tags."""
-        title_lower = title.lower()
-        tags_lower = [t.lower() for t in tags]
-        
-        if any(kw in title_lower for kw in ['report', 'outlook', 'survey']):
-            return 'report'
-        if any(kw in title_lower for kw in ['press release', 'announcement']):
-            return 'press_release'
-        if any(kw in title_lower for kw in ['working paper', 'research paper', 'paper']):
-            return 'working_paper'
-        if any(kw in title_lower for kw in ['speech', 'remarks', 'address']):
-            return 'speech'
-        if any(kw in title_lower for kw in ['blog', 'insight', 'analysis']):
-            return 'insight'
-        if 'data' in title_lower or 'statistics' in title_lower:
-            return 'data_release'
-        
-        return 'article'
+        match = _CONTENT_TYPE_RE.match(title)
+        return match.lastgroup if match else 'article'
@@ -4,19 +4,48 @@ Used for organizations without RSS feeds or to supplement RSS data.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from typing import Optional
+from urllib.parse import urlparse
 from dateutil import parser as date_parser
-import time
 import re
 
-from .base_collector import BaseCollector, Article
+from .base_collector import BaseCollector, Article, host_slot
+from .http_client import get_session
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Only <body> is kept while parsing: <head> scripts, styles and metadata are
+# never read, and every extraction strategy (including the parent/sibling
+# lookups for dates and summaries) works within the body
+_BODY_ONLY = SoupStrainer('body')
+
+# Generic links that are navigation/social rather than articles
+_SKIP_HREF_RE = re.compile(r'twitter|facebook|linkedin|mailto:|tel:|#', re.IGNORECASE)
+_SKIP_TITLE_RE = re.compile(r'read more|click here|learn more', re.IGNORECASE)
+
+# Common date formats, fused into one alternation so text is scanned once
+_DATE_RE = re.compile(
+    r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}'
+    r'|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'
+    r'|\d{4}-\d{2}-\d{2}'
+    r'|\d{1,2}/\d{1,2}/\d{4}',
+    re.IGNORECASE
+)
+
+
+
+@lru_cache(maxsize=256)
+def _site_root(base_url: str) -> str:
+    """'scheme://netloc' of a page URL; every link on a page shares it."""
+    parsed = urlparse(base_url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
 
 class WebCollector(BaseCollector):
     """
@@ -24,58 +53,68 @@ class WebCollector(BaseCollector):
     Uses BeautifulSoup for HTML parsing.
     """
     
+    # Common article container selectors: exact tag/class names first, then
+    # the broad [class*=...] matches used only when the first group finds little
+    CONTAINER_SELECTORS = (
+        'article, .article, .news-item, .publication-item, .card, .list-item, .entry, .post',
+        '[class*="article"], [class*="news"], [class*="publication"]',
+    )
+    MAX_CONTAINERS = 50  # Per selector group
+    
+    # Sent with page fetches (the shared session sets the User-Agent)
+    PAGE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+    }
+    
     def __init__(self, org_config: dict, lookback_days: int = 7):
         super().__init__(org_config, lookback_days)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': Settings.USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
+        self.session = get_session()
     
     def collect(self) -> list[Article]:
         """Collect articles by scraping configured URLs."""
         articles = []
         
-        for scrape_config in self.scrape_urls:
-            url = scrape_config.get('url', '') if isinstance(scrape_config, dict) else scrape_config
-            content_type = scrape_config.get('type', 'general') if isinstance(scrape_config, dict) else 'general'
-            
-            try:
-                page_articles = self._scrape_page(url, content_type)
-                articles.extend(page_articles)
-            except Exception as e:
-                logger.error(f"[{self.short_name}] Error scraping {url}: {e}")
-            
-            # Be polite - delay between requests
-            time.sleep(Settings.REQUEST_DELAY)
-        
-        # Remove duplicates
-        seen_urls = set()
-        unique_articles = []
-        for article in articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
-                unique_articles.append(article)
+        # Pages are fetched concurrently over the shared keep-alive session;
+        # host_slot spaces requests to each host by REQUEST_DELAY
+        if self.scrape_urls:
+            with ThreadPoolExecutor(max_workers=min(4, len(self.scrape_urls))) as executor:
+                for page_articles in executor.map(self._scrape_config_safe, self.scrape_urls):
+                    articles.extend(page_articles)
         
-        # Filter by date
-        filtered = [a for a in unique_articles if self.is_within_lookback(a.published_date)]
+        # Remove duplicates based on URL, then filter by date
+        filtered = self.unique_recent(articles)
         
         self.log_collection_result(filtered)
         return filtered
     
+    def _scrape_config_safe(self, scrape_config) -> list[Article]:
+        """Scrape one scrape_urls entry (a URL or {'url', 'type'} dict), logging errors."""
+        url = scrape_config.get('url', '') if isinstance(scrape_config, dict) else scrape_config
+        content_type = scrape_config.get('type', 'general') if isinstance(scrape_config, dict) else 'general'
+        
+        try:
+            return self._scrape_page(url, content_type)
+        except Exception as e:
+            logger.error(f"[{self.short_name}] Error scraping {url}: {e}")
+            return []
+    
     def _scrape_page(self, url: str, content_type: str) -> list[Article]:
         """Scrape a single page for articles."""
         logger.debug(f"[{self.short_name}] Scraping: {url}")
         
         try:
-            response = self.session.get(url, timeout=Settings.REQUEST_TIMEOUT)
+            with host_slot(url, Settings.REQUEST_DELAY):
+                response = self.session.get(url, headers=self.PAGE_HEADERS,
+                                            timeout=Settings.REQUEST_TIMEOUT)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"[{self.short_name}] Request failed for {url}: {e}")
             return []
         
-        soup = BeautifulSoup(response.content, 'lxml')
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=_BODY_ONLY)
+        if soup.body is None:
+            soup = BeautifulSoup(response.content, 'lxml')  # Malformed page without a body
         
         # Try different extraction strategies
         articles = []
@@ -97,27 +136,26 @@ class WebCollector(BaseCollector):
         """Extract from article/card containers."""
         articles = []
         
-        # Common article container selectors
-        selectors = [
-            'article',
-            '.article',
-            '.news-item',
-            '.publication-item',
-            '.card',
-            '.list-item',
-            '.entry',
-            '.post',
-            '[class*="article"]',
-            '[class*="news"]',
-            '[class*="publication"]',
-        ]
-        
-        for selector in selectors:
-            items = soup.select(selector)
-            for item in items[:20]:  # Limit to 20 items per selector
+        seen = set()
+        seen_urls = set()
+        max_articles = Settings.MAX_ARTICLES_PER_ORG
+        for selector in self.CONTAINER_SELECTORS:
+            # One combined select is a single tree walk and yields each element once
+            for item in soup.select(selector, limit=self.MAX_CONTAINERS):
+                if id(item) in seen:
+                    continue
+                seen.add(id(item))
                 article = self._parse_article_container(item, base_url, content_type)
-                if article:
+                # Nested containers often repeat the same link; keep one
+                if article and article.url not in seen_urls:
+                    seen_urls.add(article.url)
                     articles.append(article)
+                    if len(articles) >= max_articles:
+                        return articles  # The org is capped at this many anyway
+            
+            # Enough cards from class/tag names - skip the broad substring scan
+            if len(articles) >= 20:
+                break
         
         return articles
     
@@ -146,9 +184,7 @@ class WebCollector(BaseCollector):
             # Skip navigation links, social links, etc.
             if not title or len(title) < 20:
                 continue
-            if any(skip in href.lower() for skip in ['twitter', 'facebook', 'linkedin', 'mailto:', 'tel:', '#']):
-                continue
-            if any(skip in title.lower() for skip in ['read more', 'click here', 'learn more']):
+            if _SKIP_HREF_RE.search(href) or _SKIP_TITLE_RE.search(title):
                 continue
             
             # Build full URL
@@ -249,10 +285,7 @@ class WebCollector(BaseCollector):
         if href.startswith('//'):
             return 'https:' + href
         if href.startswith('/'):
-            # Extract domain from base_url
-            from urllib.parse import urlparse
-            parsed = urlparse(base_url)
-            return f"{parsed.scheme}://{parsed.netloc}{href}"
+            return _site_root(base_url) + href
         # Relative path
         return base_url.rstrip('/') + '/' + href.lstrip('/')
     
@@ -266,21 +299,9 @@ class WebCollector(BaseCollector):
             return None
     
     def _extract_date_from_text(self, text: str) -> Optional[datetime]:
-        """Try to extract a date from mixed text."""
-        # Common date patterns
-        patterns = [
-            r'\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
-            r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}',
-            r'\d{4}-\d{2}-\d{2}',
-            r'\d{1,2}/\d{1,2}/\d{4}',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._parse_date(match.group())
-        
-        return None
+        """Try to extract a date from mixed text (the first one found)."""
+        match = _DATE_RE.search(text)
+        return self._parse_date(match.group()) if match else None
     
     def _find_nearby_date(self, element) -> Optional[datetime]:
         """Find a date in elements near the given element."""
@@ -293,8 +314,8 @@ class WebCollector(BaseCollector):
                 return self._parse_date(date_str)
         
         # Check siblings
-        for sibling in element.find_next_siblings()[:3]:
-            if 'date' in str(sibling.get('class', '')):
+        for sibling in element.find_next_siblings(limit=3):
+            if any('date' in cls for cls in sibling.get('class') or ()):
                 return self._parse_date(sibling.get_text(strip=True))
         
         return None
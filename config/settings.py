@@ -9,6 +9,9 @@ from typing import Optional
 from dotenv import load_dotenv
 import yaml
 
+# libyaml's C loader when available, same safe semantics
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Load environment variables
 load_dotenv()
 
@@ -20,14 +23,16 @@ class Settings:
     NVIDIA_API_KEY: str = os.getenv('NVIDIA_API_KEY', '')
     GEMINI_API_KEY: str = os.getenv('GEMINI_API_KEY', '')  # Legacy fallback
     OPENROUTER_API_KEY: str = os.getenv('OPENROUTER_API_KEY', '')
+    FRED_API_KEY: str = os.getenv('FRED_API_KEY', '')  # Optional; FRED's demo key is used if unset
 
     # Email Configuration
     EMAIL_ADDRESS: str = os.getenv('EMAIL_ADDRESS', '')
     EMAIL_APP_PASSWORD: str = os.getenv('EMAIL_APP_PASSWORD', '')
     RECIPIENT_EMAIL: str = os.getenv('RECIPIENT_EMAIL', '')
-    RECIPIENT_EMAILS: list[str] = [
+    # Deduplicated in order; RECIPIENT_EMAIL is the fallback, never an empty address
+    RECIPIENT_EMAILS: tuple[str, ...] = tuple(dict.fromkeys(
         e.strip() for e in os.getenv('RECIPIENT_EMAILS', '').split(',') if e.strip()
-    ] or [os.getenv('RECIPIENT_EMAIL', '')]
+    )) or tuple(e for e in (RECIPIENT_EMAIL.strip(),) if e)
 
     # Gmail SMTP Settings
     SMTP_SERVER: str = 'smtp.gmail.com'
@@ -41,6 +46,7 @@ class Settings:
     BASE_DIR: Path = Path(__file__).parent.parent
     CONFIG_DIR: Path = BASE_DIR / 'config'
     OUTPUT_DIR: Path = BASE_DIR / 'output'
+    CACHE_DIR: Path = BASE_DIR / 'cache'
 
     # User Agent for web requests
     USER_AGENT: str = (
@@ -50,17 +56,30 @@ class Settings:
 
     # Request settings
     REQUEST_TIMEOUT: int = 30
-    REQUEST_DELAY: float = 1.0  # Delay between requests to be polite
+    REQUEST_DELAY: float = 1.0  # Minimum seconds between page scrapes on one site
+    MAX_COLLECTOR_WORKERS: int = 16  # Organizations collected in parallel
+    MAX_REQUESTS_PER_HOST: int = 4  # Concurrent requests to any one site
+    HOST_REQUEST_INTERVAL: float = 0.5  # Minimum seconds between request starts to one site
+
+    # (mtime, organizations) of the last organizations.yaml parse
+    _org_cache: tuple = (None, None)
 
     @classmethod
     def load_organizations(cls) -> list[dict]:
-        """Load organization configurations from YAML file."""
+        """
+        Load organization configurations from YAML file.
+        
+        The parsed list is cached until the file's mtime changes.
+        """
         org_file = cls.CONFIG_DIR / 'organizations.yaml'
-        if org_file.exists():
+        if not org_file.exists():
+            return []
+        mtime = org_file.stat().st_mtime
+        if cls._org_cache[0] != mtime:
             with open(org_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                return data.get('organizations', [])
-        return []
+                data = yaml.load(f, Loader=_YAML_LOADER)
+            cls._org_cache = (mtime, data.get('organizations', []))
+        return list(cls._org_cache[1])
 
     @classmethod
     def ensure_output_dir(cls) -> Path:
@@ -78,6 +97,6 @@ class Settings:
             missing.append('EMAIL_ADDRESS')
         if not cls.EMAIL_APP_PASSWORD:
             missing.append('EMAIL_APP_PASSWORD')
-        if not cls.RECIPIENT_EMAIL and not cls.RECIPIENT_EMAILS:
+        if not cls.RECIPIENT_EMAILS:
             missing.append('RECIPIENT_EMAIL or RECIPIENT_EMAILS')
         return missing
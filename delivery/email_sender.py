@@ -2,32 +2,363 @@
 Email Sender - Delivers reports via Gmail SMTP.
 """
 
+import atexit
+import base64
+import queue
 import smtplib
+import threading
+import time
+import uuid
+import weakref
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
+from concurrent.futures import Future
+from functools import partial
 from pathlib import Path
+from typing import Optional
+from html.parser import HTMLParser
 import logging
+import re
+from string import Template
 
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Open senders, closed (pending sends flushed) at interpreter exit. Weak, so a
+# closed sender that goes out of scope is not kept alive by the registry.
+_live_senders = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_senders():
+    for sender in list(_live_senders):
+        sender.close()
+
+
+# Weekly report email body; the stylesheet is static, only the ${...} fields vary
+_WEEKLY_REPORT_TEMPLATE = Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <style>
+                body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }
+                .header { background: linear-gradient(135deg, #0d1b2a 0%, #1b3a4b 100%); color: white; padding: 30px 20px; text-align: center; }
+                .header h1 { margin: 0; font-size: 24px; letter-spacing: 2px; }
+                .header .subtitle { font-size: 14px; opacity: 0.9; margin-top: 5px; }
+                .content { padding: 20px; background: #f8fafc; }
+                .summary { background: white; padding: 20px; border-radius: 8px; margin: 15px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1); border-left: 4px solid #1b3a4b; }
+                .stats { display: flex; gap: 15px; margin: 15px 0; justify-content: center; flex-wrap: wrap; }
+                .stat-box { background: white; padding: 15px 20px; border-radius: 8px; text-align: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1); min-width: 100px; }
+                .stat-number { font-size: 28px; font-weight: bold; color: #1b3a4b; }
+                .stat-label { color: #718096; font-size: 12px; }
+                .footer { background: #0d1b2a; color: white; padding: 20px; text-align: center; font-size: 11px; }
+                h2 { color: #1b3a4b; border-bottom: 2px solid #e2e8f0; padding-bottom: 10px; font-size: 18px; }
+                @media (max-width: 600px) {
+                    .header h1 { font-size: 20px; }
+                    .stat-number { font-size: 24px; }
+                    .stats { flex-direction: column; align-items: center; }
+                }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>THE GLOBAL PULSE</h1>
+                <div class="subtitle">Weekly Economic Intelligence</div>
+                <p style="margin: 10px 0 0 0; opacity: 0.8; font-size: 13px;">${date_range}</p>
+            </div>
+
+            <div class="content">
+                <div class="stats">
+                    <div class="stat-box">
+                        <div class="stat-number">${total_articles}</div>
+                        <div class="stat-label">Articles Analyzed</div>
+                    </div>
+                    <div class="stat-box">
+                        <div class="stat-number">39</div>
+                        <div class="stat-label">Organizations</div>
+                    </div>
+                    <div class="stat-box">
+                        <div class="stat-number">7</div>
+                        <div class="stat-label">AI Models</div>
+                    </div>
+                </div>
+
+                ${tldr_html}
+
+                ${sentiment_html}
+
+                <h2>Executive Summary</h2>
+                <div class="summary">
+                    <p style="margin: 0; font-size: 14px;">${summary_html}</p>
+                </div>
+
+                <div style="background: #e2e8f0; padding: 15px; border-radius: 8px; margin: 15px 0;">
+                    <strong>Full Reports Attached:</strong>
+                    <ul style="margin: 10px 0; padding-left: 20px; font-size: 13px;">
+                        <li><strong>${doc_name}</strong> — Complete analysis with deep PDF insights</li>
+                        <li><strong>${excel_name}</strong> — All articles with scores, themes, and links</li>
+                    </ul>
+                </div>
+
+                <p style="color: #718096; font-size: 12px; text-align: center; margin-top: 20px;">
+                    Sentiment Analysis &bull; Actionable Implications &bull; Regional Breakdown &bull;
+                    Cross-Source Intelligence &bull; Key Economic Numbers
+                </p>
+            </div>
+
+            <div class="footer">
+                <p><strong>THE GLOBAL PULSE</strong></p>
+                <p style="opacity: 0.7;">Automated Weekly Intelligence | Powered by NVIDIA NIM 7-Model Architecture</p>
+            </div>
+        </body>
+        </html>
+        """)
+
+
+class _PlainTextParser(HTMLParser):
+    """
+    Single-pass HTML -> plain text converter for the text/plain alternative.
+    Entities (named and numeric) are decoded by the parser itself, and the
+    contents of <head>, <style> and <script> are dropped.
+    """
+
+    LINE_BREAK_TAGS = frozenset({'br', 'p'})
+    HIDDEN_TAGS = frozenset({'head', 'style', 'script'})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        self._hidden_depth = 0
+
+    def convert(self, html: str) -> str:
+        """Return the text content of ``html``."""
+        self.reset()
+        self._parts = []
+        self._hidden_depth = 0
+        self.feed(html)
+        self.close()
+        return ''.join(self._parts).replace('\xa0', ' ').strip()
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HIDDEN_TAGS:
+            self._hidden_depth += 1
+        elif tag in self.LINE_BREAK_TAGS and not self._hidden_depth:
+            self._parts.append('\n')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == 'br' and not self._hidden_depth:
+            self._parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.HIDDEN_TAGS and self._hidden_depth:
+            self._hidden_depth -= 1
+
+    def handle_data(self, data):
+        if not self._hidden_depth:
+            self._parts.append(data)
+
+
+class _SMTPSession:
+    """
+    One reusable authenticated SMTP connection.
+    
+    Recycled after MAX_MESSAGES messages or once idle longer than
+    IDLE_TIMEOUT (Gmail drops idle sessions itself).
+    """
+    
+    MAX_MESSAGES = 100
+    IDLE_TIMEOUT = 240  # Seconds
+    
+    def __init__(self, host: str, port: int, user: str, password: str):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self._conn: smtplib.SMTP = None
+        self._sent_count = 0
+        self._last_used = 0.0
+        self._lock = threading.RLock()
+    
+    def connection(self) -> smtplib.SMTP:
+        """Return the authenticated connection, (re)connecting if needed."""
+        with self._lock:
+            if self._conn is not None and (
+                self._sent_count >= self.MAX_MESSAGES
+                or time.monotonic() - self._last_used > self.IDLE_TIMEOUT
+            ):
+                self.close()
+            
+            if self._conn is None:
+                server = smtplib.SMTP(self.host, self.port)
+                try:
+                    server.starttls()
+                    server.login(self.user, self.password)
+                except Exception:
+                    server.close()
+                    raise
+                self._conn = server
+                self._sent_count = 0
+            
+            self._last_used = time.monotonic()
+            return self._conn
+    
+    def send(self, msg: MIMEMultipart):
+        """Send a message, reconnecting once if the server hung up."""
+        with self._lock:
+            try:
+                self.connection().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self.close()
+                self.connection().send_message(msg)
+            except Exception:
+                self.close()
+                raise
+            self._sent_count += 1
+            self._last_used = time.monotonic()
+    
+    def close(self):
+        """Close the connection, if open."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.quit()
+            except Exception:
+                self._conn.close()
+            self._conn = None
+            self._sent_count = 0
+
 
 class EmailSender:
     """
     Sends email reports with attachments via Gmail SMTP.
     Requires Gmail App Password for authentication.
+    
+    Authenticated SMTP connections are kept open and reused across sends.
+    Messages are handed to background workers over a bounded queue, so
+    submit_report() returns as soon as the message is built. With
+    concurrency > 1 the recipient list is split into that many shards, each
+    sent as its own message over its own connection in parallel.
+    
+    Use as a context manager (or call close()) to flush and disconnect;
+    senders still open at interpreter exit are closed then.
     """
     
-    def __init__(self):
-        """Initialize the email sender."""
+    MAX_SMTP_CONNECTIONS = 15  # Gmail's limit on simultaneous connections
+    SEND_QUEUE_SIZE = 8  # Pending messages before submit_report() blocks
+    # Attachment read size: a multiple of 57 bytes, so each chunk encodes to
+    # whole 76-character base64 lines and the chunks concatenate cleanly
+    ATTACHMENT_CHUNK_SIZE = 57 * 3456  # ~192 KiB
+    
+    def __init__(self, concurrency: int = 1):
+        """
+        Initialize the email sender.
+        
+        Args:
+            concurrency: Parallel SMTP connections (capped at MAX_SMTP_CONNECTIONS)
+        """
         self.smtp_server = Settings.SMTP_SERVER
         self.smtp_port = Settings.SMTP_PORT
         self.sender_email = Settings.EMAIL_ADDRESS
         self.sender_password = Settings.EMAIL_APP_PASSWORD
         self.recipients = Settings.RECIPIENT_EMAILS
+        self.concurrency = max(1, min(concurrency, self.MAX_SMTP_CONNECTIONS))
+        # Connections are opened lazily, the first time a worker uses them
+        self._sessions = [
+            _SMTPSession(self.smtp_server, self.smtp_port, self.sender_email, self.sender_password)
+            for _ in range(self.concurrency)
+        ]
+        self._idle_sessions: queue.LifoQueue = queue.LifoQueue()
+        for session in self._sessions:
+            self._idle_sessions.put(session)
+        self._queue: queue.Queue = queue.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._workers: list[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+        _live_senders.add(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _ensure_workers(self):
+        """Start the send workers on first use."""
+        with self._workers_lock:
+            self._workers = [w for w in self._workers if w.is_alive()]
+            while len(self._workers) < self.concurrency:
+                worker = threading.Thread(target=self._run_worker, daemon=True,
+                                          name=f'email-sender-{len(self._workers)}')
+                worker.start()
+                self._workers.append(worker)
+    
+    def _run_worker(self):
+        """Drain the send queue, borrowing a pooled connection per message."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:  # Stop sentinel from close()
+                    return
+                msg, recipients, future = item
+                future.set_result(self._deliver(msg, recipients))
+            finally:
+                self._queue.task_done()
+    
+    def _deliver(self, msg: MIMEMultipart, recipients: list[str]) -> bool:
+        """Send a built message, logging the outcome."""
+        session = self._idle_sessions.get()
+        try:
+            session.send(msg)
+            logger.info(f"Email sent successfully to {', '.join(recipients)}")
+            return True
+        except smtplib.SMTPAuthenticationError as e:
+            logger.error(f"SMTP authentication failed: {e}")
+            logger.error("Make sure you're using a Gmail App Password, not your regular password")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to send email: {e}")
+            return False
+        finally:
+            self._idle_sessions.put(session)
+    
+    @staticmethod
+    def _gather(futures: list[Future]) -> Future:
+        """Future that resolves to True once every shard future has resolved True."""
+        combined = Future()
+        remaining = [len(futures)]
+        lock = threading.Lock()
+        
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            combined.set_result(all(f.result() for f in futures))
+        
+        for future in futures:
+            future.add_done_callback(on_done)
+        return combined
+    
+    def close(self):
+        """
+        Flush pending sends, stop the workers and close the SMTP connections.
+        
+        Also runs at interpreter exit for senders still open; the sender can
+        be used again afterwards (workers and connections restart on demand).
+        """
+        with self._workers_lock:
+            workers, self._workers = self._workers, []
+        if workers:
+            self._queue.join()
+            for _ in workers:
+                self._queue.put(None)
+            for worker in workers:
+                worker.join()
+        for session in self._sessions:
+            session.close()
     
     def send_report(
         self,
@@ -37,7 +368,7 @@ class EmailSender:
         recipients: list[str] = None
     ) -> bool:
         """
-        Send an email with attachments.
+        Send an email with attachments, waiting for the result.
         
         Args:
             subject: Email subject
@@ -48,26 +379,43 @@ class EmailSender:
         Returns:
             True if email sent successfully, False otherwise
         """
+        return self.submit_report(subject, body_html, attachments, recipients).result()
+    
+    def submit_report(
+        self,
+        subject: str,
+        body_html: str,
+        attachments: list[Path],
+        recipients: list[str] = None
+    ) -> Future:
+        """
+        Build an email and queue it for the background senders.
+        
+        Blocks only while the send queue is full. Arguments are as for
+        send_report().
+        
+        Returns:
+            Future resolving to True if the email was sent to every recipient
+            shard, False otherwise
+        """
+        future = Future()
         if recipients is None:
             recipients = self.recipients
         
         if not recipients or not recipients[0]:
             logger.error("No recipients configured")
-            return False
+            future.set_result(False)
+            return future
         
         if not self.sender_email or not self.sender_password:
             logger.error("Email credentials not configured")
-            return False
+            future.set_result(False)
+            return future
         
         try:
-            # Create message
-            msg = MIMEMultipart('mixed')
-            msg['From'] = self.sender_email
-            msg['To'] = ', '.join(recipients)
-            msg['Subject'] = subject
-            
-            # Add body
-            body_part = MIMEMultipart('alternative')
+            # Build the body and attachment parts once; every shard message shares them
+            # (explicit boundary: the generator would otherwise set one on first send)
+            body_part = MIMEMultipart('alternative', boundary=f"=={uuid.uuid4().hex}==")
             
             # Plain text version
             plain_text = self._html_to_plain(body_html)
@@ -76,67 +424,77 @@ class EmailSender:
             # HTML version
             body_part.attach(MIMEText(body_html, 'html'))
             
-            msg.attach(body_part)
+            parts = [body_part]
             
             # Add attachments
             for attachment_path in attachments:
                 if attachment_path.exists():
-                    self._attach_file(msg, attachment_path)
+                    part = self._attachment_part(attachment_path)
+                    if part is not None:
+                        parts.append(part)
                 else:
                     logger.warning(f"Attachment not found: {attachment_path}")
             
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-            
-            logger.info(f"Email sent successfully to {', '.join(recipients)}")
-            return True
-            
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
-            logger.error("Make sure you're using a Gmail App Password, not your regular password")
-            return False
         except Exception as e:
-            logger.error(f"Failed to send email: {e}")
-            return False
+            logger.error(f"Failed to build email: {e}")
+            future.set_result(False)
+            return future
+        
+        # Send email: one message per recipient shard
+        shard_count = min(self.concurrency, len(recipients))
+        shards = [list(recipients[i::shard_count]) for i in range(shard_count)]
+        self._ensure_workers()
+        if shard_count == 1:
+            self._queue.put((self._message(subject, shards[0], parts), shards[0], future))
+            return future
+        
+        shard_futures = []
+        for shard in shards:
+            shard_futures.append(Future())
+            self._queue.put((self._message(subject, shard, parts), shard, shard_futures[-1]))
+        return self._gather(shard_futures)
     
-    def _attach_file(self, msg: MIMEMultipart, file_path: Path):
-        """Attach a file to the email."""
+    def _message(self, subject: str, recipients: list[str], parts: list) -> MIMEMultipart:
+        """Outer message for one set of recipients, wrapping the shared parts."""
+        msg = MIMEMultipart('mixed')
+        msg['From'] = self.sender_email
+        msg['To'] = ', '.join(recipients)
+        msg['Subject'] = subject
+        for part in parts:
+            msg.attach(part)
+        return msg
+    
+    def _attachment_part(self, file_path: Path) -> Optional[MIMEBase]:
+        """Build the base64 attachment part for a file (None if it can't be read)."""
         try:
-            with open(file_path, 'rb') as f:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(f.read())
+            # Encode while reading so the raw file is never held in memory whole
+            with open(file_path, 'rb', buffering=self.ATTACHMENT_CHUNK_SIZE) as f:
+                encoded = ''.join(
+                    base64.encodebytes(chunk).decode('ascii')
+                    for chunk in iter(partial(f.read, self.ATTACHMENT_CHUNK_SIZE), b'')
+                )
             
-            encoders.encode_base64(part)
+            part = MIMEBase('application', 'octet-stream')
+            part.set_payload(encoded)
+            part['Content-Transfer-Encoding'] = 'base64'
             part.add_header(
                 'Content-Disposition',
                 f'attachment; filename="{file_path.name}"'
             )
-            msg.attach(part)
             logger.debug(f"Attached: {file_path.name}")
+            return part
         except Exception as e:
             logger.error(f"Failed to attach {file_path}: {e}")
+            return None
     
     def _html_to_plain(self, html: str) -> str:
-        """Convert HTML to plain text (simple conversion)."""
-        # Simple conversion - remove tags
-        import re
-        text = re.sub(r'<br\s*/?>', '\n', html)
-        text = re.sub(r'<p[^>]*>', '\n', text)
-        text = re.sub(r'</p>', '', text)
-        text = re.sub(r'<[^>]+>', '', text)
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        return text.strip()
+        """Convert HTML to plain text (line breaks for <br>/<p>, tags and CSS dropped)."""
+        # A fresh parser per call: it buffers state, and messages may be built concurrently
+        return _PlainTextParser().convert(html)
     
     @staticmethod
     def _markdown_to_html(text: str) -> str:
         """Convert markdown bold/italic to HTML tags."""
-        import re
         # **bold** -> <b>bold</b>
         text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
         # *italic* -> <i>italic</i>
@@ -197,84 +555,15 @@ class EmailSender:
             </div>
             '''
 
-        body_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; }}
-                .header {{ background: linear-gradient(135deg, #0d1b2a 0%, #1b3a4b 100%); color: white; padding: 30px 20px; text-align: center; }}
-                .header h1 {{ margin: 0; font-size: 24px; letter-spacing: 2px; }}
-                .header .subtitle {{ font-size: 14px; opacity: 0.9; margin-top: 5px; }}
-                .content {{ padding: 20px; background: #f8fafc; }}
-                .summary {{ background: white; padding: 20px; border-radius: 8px; margin: 15px 0; box-shadow: 0 2px 4px rgba(0,0,0,0.1); border-left: 4px solid #1b3a4b; }}
-                .stats {{ display: flex; gap: 15px; margin: 15px 0; justify-content: center; flex-wrap: wrap; }}
-                .stat-box {{ background: white; padding: 15px 20px; border-radius: 8px; text-align: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1); min-width: 100px; }}
-                .stat-number {{ font-size: 28px; font-weight: bold; color: #1b3a4b; }}
-                .stat-label {{ color: #718096; font-size: 12px; }}
-                .footer {{ background: #0d1b2a; color: white; padding: 20px; text-align: center; font-size: 11px; }}
-                h2 {{ color: #1b3a4b; border-bottom: 2px solid #e2e8f0; padding-bottom: 10px; font-size: 18px; }}
-                @media (max-width: 600px) {{
-                    .header h1 {{ font-size: 20px; }}
-                    .stat-number {{ font-size: 24px; }}
-                    .stats {{ flex-direction: column; align-items: center; }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>THE GLOBAL PULSE</h1>
-                <div class="subtitle">Weekly Economic Intelligence</div>
-                <p style="margin: 10px 0 0 0; opacity: 0.8; font-size: 13px;">{date_range}</p>
-            </div>
-
-            <div class="content">
-                <div class="stats">
-                    <div class="stat-box">
-                        <div class="stat-number">{total_articles}</div>
-                        <div class="stat-label">Articles Analyzed</div>
-                    </div>
-                    <div class="stat-box">
-                        <div class="stat-number">39</div>
-                        <div class="stat-label">Organizations</div>
-                    </div>
-                    <div class="stat-box">
-                        <div class="stat-number">7</div>
-                        <div class="stat-label">AI Models</div>
-                    </div>
-                </div>
-
-                {tldr_html}
-
-                {sentiment_html}
-
-                <h2>Executive Summary</h2>
-                <div class="summary">
-                    <p style="margin: 0; font-size: 14px;">{summary_html}</p>
-                </div>
-
-                <div style="background: #e2e8f0; padding: 15px; border-radius: 8px; margin: 15px 0;">
-                    <strong>Full Reports Attached:</strong>
-                    <ul style="margin: 10px 0; padding-left: 20px; font-size: 13px;">
-                        <li><strong>{doc_path.name}</strong> — Complete analysis with deep PDF insights</li>
-                        <li><strong>{excel_path.name}</strong> — All articles with scores, themes, and links</li>
-                    </ul>
-                </div>
-
-                <p style="color: #718096; font-size: 12px; text-align: center; margin-top: 20px;">
-                    Sentiment Analysis &bull; Actionable Implications &bull; Regional Breakdown &bull;
-                    Cross-Source Intelligence &bull; Key Economic Numbers
-                </p>
-            </div>
-
-            <div class="footer">
-                <p><strong>THE GLOBAL PULSE</strong></p>
-                <p style="opacity: 0.7;">Automated Weekly Intelligence | Powered by NVIDIA NIM 7-Model Architecture</p>
-            </div>
-        </body>
-        </html>
-        """
+        body_html = _WEEKLY_REPORT_TEMPLATE.substitute(
+            date_range=date_range,
+            total_articles=total_articles,
+            tldr_html=tldr_html,
+            sentiment_html=sentiment_html,
+            summary_html=summary_html,
+            doc_name=doc_path.name,
+            excel_name=excel_path.name,
+        )
 
         return self.send_report(
             subject=subject,
@@ -285,9 +574,14 @@ class EmailSender:
     def test_connection(self) -> bool:
         """Test the email connection without sending."""
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
+            session = self._idle_sessions.get()
+            try:
+                session.connection().noop()
+            except Exception:
+                session.close()
+                raise
+            finally:
+                self._idle_sessions.put(session)
             logger.info("Email connection test successful")
             return True
         except Exception as e:
@@ -97,7 +97,7 @@ def run_agent(
             all_orgs = Settings.load_organizations()
             orgs_to_use = [org['short_name'] for org in all_orgs[:limit_orgs]]
 
-        articles_by_org = collector.collect_all(max_workers=5, specific_orgs=orgs_to_use)
+        articles_by_org = collector.collect_all(specific_orgs=orgs_to_use)
 
         # Get flat list of all articles
         all_articles = collector.get_all_articles_flat(articles_by_org)
@@ -185,12 +185,15 @@ def run_agent(
                     logger.info("[NVIDIA]   🟣 Llama 4 Maverick → chart/image vision")
                     logger.info("[NVIDIA]   🔴 OCDRNet → OCR for scanned PDFs")
 
+                    # Downloads are pure I/O - fetch them all up front in parallel
+                    pdf_paths = pdf_processor.download_many([a.url for a in major_articles])
+
                     for i, article in enumerate(major_articles):
                         if analyzer.quota_exhausted:
                             logger.warning(f"[DEEP ANALYSIS] Stopping - credits exhausted after {deep_analyzed_count} reports")
                             break
 
-                        pdf_path = pdf_processor.download_pdf(article.url)
+                        pdf_path = pdf_paths.get(article.url)
 
                         if pdf_path:
                             logger.info(f"[DEEP ANALYSIS] Processing {i+1}/{len(major_articles)}: {article.title[:50]}...")